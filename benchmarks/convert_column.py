@@ -0,0 +1,80 @@
+"""
+Compares converting table cells one at a time with `convert_to_num`, the way rows used to be sanitised, against
+converting whole columns at once with `convert_column`.
+
+Usage:
+    python3 benchmarks/convert_column.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coronainfo.utils import functions
+from coronainfo.utils.functions import convert_column, convert_to_num
+
+NUMERIC_COLUMNS = 13
+
+
+def make_cell(rng: random.Random) -> str:
+    return rng.choice([
+        f"{rng.randint(0, 10 ** 9):,}",
+        f"+{rng.randint(0, 10 ** 5):,}",
+        f"-{rng.randint(1, 500)}",
+        f"{rng.randint(0, 999)}.{rng.randint(0, 9)}",
+        "N/A",
+        "",
+    ]) + rng.choice(["", " ", "\n"])
+
+
+def convert_per_cell(column: list[str]) -> list[int]:
+    result = []
+    for value in column:
+        sanitised_value = value.replace(",", "").strip()
+        if sanitised_value == "N/A":
+            sanitised_value = None
+
+        clean_value = convert_to_num(sanitised_value)
+        if isinstance(clean_value, float):
+            clean_value = int(clean_value)
+        result.append(clean_value)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[230, 20000], help="rows per table")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs per method")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    numpy_available = functions.NUMPY_AVAILABLE
+    print(f"NumPy available: {numpy_available}")
+
+    for rows in args.rows:
+        columns = [[make_cell(rng) for _ in range(rows)] for _ in range(NUMERIC_COLUMNS)]
+        methods = {"per cell": lambda: [convert_per_cell(column) for column in columns]}
+
+        threshold = functions.NUMPY_THRESHOLD
+        functions.NUMPY_THRESHOLD = float("inf")
+        methods["column"] = lambda: [convert_column(column) for column in columns]
+        if numpy_available:
+            methods["column (numpy)"] = lambda: [functions._convert_column_numpy(column) for column in columns]
+
+        expected = methods["per cell"]()
+        print(f"\n{rows:,} rows x {NUMERIC_COLUMNS} columns")
+        for name, method in methods.items():
+            matches = [list(column) for column in method()] == expected
+            best = min(timeit.repeat(method, number=1, repeat=args.repeat))
+            print(f"{name:>15}: best {best * 1000:8.2f} ms | {'identical' if matches else 'MISMATCH'}")
+
+        functions.NUMPY_THRESHOLD = threshold
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Times every available parser backend against saved worldometers pages and checks that they all produce identical
+`CoronaData` lists.
+
+Usage:
+    python3 benchmarks/parse_backends.py [--save snapshot.html] [--repeat N] snapshot.html [snapshot.html ...]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coronainfo.utils.parsers import PARSER_BACKENDS, TODAY_TABLE_ID, available_backends, parse_table
+
+WORLDOMETERS_URL = "https://www.worldometers.info/coronavirus/"
+
+
+def save_snapshot(path: Path):
+    print(f"Saving {WORLDOMETERS_URL} to {path}")
+    with urllib.request.urlopen(WORLDOMETERS_URL) as response:
+        path.write_bytes(response.read())
+
+
+def peak_memory(html: str, backend: str) -> int:
+    tracemalloc.start()
+    list(parse_table(html, TODAY_TABLE_ID, backend))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def bench_snapshot(path: Path, repeat: int) -> bool:
+    html = path.read_text(encoding="utf-8", errors="replace")
+    print(f"\n{path} ({len(html) / 1024:,.0f} KiB)")
+
+    backends = available_backends()
+    missing = sorted(set(PARSER_BACKENDS) - {backend.name for backend in backends})
+    if missing:
+        print(f"Skipping unavailable backends: {', '.join(missing)}")
+
+    reference = None
+    identical = True
+    for backend in backends:
+        rows = list(parse_table(html, TODAY_TABLE_ID, backend.name))
+        if reference is None:
+            reference = rows
+        matches = rows == reference
+        identical &= matches
+
+        timings = timeit.repeat(lambda: list(parse_table(html, TODAY_TABLE_ID, backend.name)), number=1, repeat=repeat)
+        peak = peak_memory(html, backend.name)
+        print(f"{backend.name:>12}: best {min(timings) * 1000:8.2f} ms | peak {peak / 1024:10,.0f} KiB | "
+              f"{len(rows)} rows | {'identical' if matches else 'MISMATCH'}")
+
+    return identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("snapshots", nargs="*", type=Path, help="saved worldometers HTML pages")
+    parser.add_argument("--save", type=Path, help="download the current page to this path and benchmark it too")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs per backend")
+    args = parser.parse_args()
+
+    snapshots = list(args.snapshots)
+    if args.save:
+        save_snapshot(args.save)
+        snapshots.append(args.save)
+
+    if not snapshots:
+        parser.error("no snapshots given")
+
+    identical = all([bench_snapshot(path, args.repeat) for path in snapshots])
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# __main__.py
+#
+# Copyright 2022 Izzat Z.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless entry point, for running the fetch, parse and cache pipeline without a display:
+
+    python -m coronainfo fetch --format csv --output today.csv
+    python -m coronainfo history --format ndjson --output history.ndjson
+
+Nothing here imports GTK.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import timedelta
+from typing import Callable, Union
+
+from coronainfo.enums import App, Paths
+from coronainfo.models import CoronaDataset
+from coronainfo.models.model_dataset import FIELD_NAMES
+from coronainfo.service import DataService
+from coronainfo.settings import AppSettings
+from coronainfo.utils.export import EXPORT_FORMATS, ExportTable, export_history, export_table, format_for_path
+from coronainfo.utils.history import SnapshotStore
+from coronainfo.utils.parsers import PARSER_BACKENDS
+
+
+def main(argv: list[str] = None) -> int:
+    args = _parse_args(argv)
+    Paths.ensure_dirs()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose or os.environ.get("CORONAINFO_DEBUG") else logging.WARNING,
+        format="[%(asctime)s | %(levelname)s]: %(message)s",
+        stream=sys.stderr  # Standard output may be the data itself
+    )
+    return args.command(args)
+
+
+def fetch(args: argparse.Namespace) -> int:
+    settings = AppSettings.fetch_settings()
+    if args.backend:
+        settings.parser_backend = args.backend
+
+    service = DataService(settings)
+    try:
+        if args.max_age is not None and not service.is_stale(timedelta(minutes=args.max_age)):
+            data = service.read_cache()
+        elif args.cached:
+            data = service.get_data(use_cache=True)
+        else:
+            data = service.refresh()
+    except (OSError, ValueError) as err:
+        # Every copy of the cache that failed has already been logged along with its own error
+        print("Unable to read the cached data, see the log above for details", file=sys.stderr)
+        return 1
+
+    if data is None:
+        print("Unable to fetch data, see the log above for details", file=sys.stderr)
+        return 1
+
+    settings.commit()
+    if isinstance(data, CoronaDataset):
+        table = ExportTable.from_dataset(data, _fields(args))
+    else:
+        table = ExportTable.from_rows([row.as_tuple() for row in data], _fields(args))
+
+    return _write(args, lambda file, export_format: export_table(table, file, export_format))
+
+
+def history(args: argparse.Namespace) -> int:
+    store = SnapshotStore(Paths.HISTORY_DIR)
+    if not store.entries():
+        print("There is no history to export yet", file=sys.stderr)
+        return 1
+
+    return _write(args, lambda file, export_format: export_history(store, file, export_format, _fields(args)))
+
+
+def _write(args: argparse.Namespace, export: Callable) -> int:
+    # The format defaults to whatever the extension of the output file says, and to JSON for standard output
+    export_format = args.format or format_for_path(args.output, default="json")
+    if args.columns and EXPORT_FORMATS[export_format].all_fields:
+        print(f"The {export_format} format always holds every field, --columns cannot be used with it", file=sys.stderr)
+        return 1
+
+    binary = EXPORT_FORMATS[export_format].binary
+    if args.output == "-":
+        export(sys.stdout.buffer if binary else sys.stdout, export_format)
+    else:
+        with open(args.output, "wb") if binary else open(args.output, "w", newline="", encoding="utf-8") as file:
+            export(file, export_format)
+
+    return 0
+
+
+def _fields(args: argparse.Namespace) -> Union[list[int], None]:
+    if not args.columns:
+        return None
+    return [FIELD_NAMES.index(name) for name in args.columns.split(",")]
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("-f", "--format", choices=tuple(EXPORT_FORMATS),
+                        help="output format (default: from the output file's extension, or json)")
+    parser.add_argument("-o", "--output", default="-", help="file to write to (default: standard output)")
+    parser.add_argument("-c", "--columns", type=_columns, metavar="NAMES",
+                        help="comma-separated fields to write, in order (default: every field, which binary requires)")
+
+
+def _columns(value: str) -> str:
+    unknown = [name for name in value.split(",") if name not in FIELD_NAMES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown fields: {', '.join(unknown)} (choose from {', '.join(FIELD_NAMES)})")
+    return value
+
+
+def _parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="coronainfo", description=f"{App.NAME} {App.VERSION}, without the window")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to standard error")
+    commands = parser.add_subparsers(required=True, metavar="command")
+
+    fetch_parser = commands.add_parser("fetch", help="fetch today's data, update the cache and write it out")
+    fetch_parser.set_defaults(command=fetch)
+    _add_output_arguments(fetch_parser)
+    fetch_parser.add_argument("-b", "--backend", choices=tuple(PARSER_BACKENDS), help="HTML parser backend to use")
+    fetch_parser.add_argument("--cached", action="store_true", help="use the cache instead if there is one")
+    fetch_parser.add_argument("--max-age", type=int, metavar="MINUTES",
+                              help="use the cache instead if it was fetched less than this many minutes ago")
+
+    history_parser = commands.add_parser("history", help="write every snapshot in the history, oldest first")
+    history_parser.set_defaults(command=history)
+    _add_output_arguments(history_parser)
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,27 +5,35 @@ from datetime import datetime
 
 from coronainfo.enums import Date, Paths
 
-FILE_NAME = str(Paths.LOGS_DIR / f"coronainfo_{datetime.now().strftime(Date.FILE_FORMAT)}.log")
 FORMAT = "[%(asctime)s | %(levelname)s]: %(message)s"
 DATE_FORMAT = Date.RAW_FORMAT
 LEVEL = logging.DEBUG if os.environ.get("CORONAINFO_DEBUG") else logging.INFO
 
 FORMATTER = logging.Formatter(fmt=FORMAT, datefmt=DATE_FORMAT)
 
-FILE_HANDLER = logging.FileHandler(filename=FILE_NAME, mode="w", encoding="utf-8")
-FILE_HANDLER.setLevel(logging.DEBUG)  # Always DEBUG for file
-FILE_HANDLER.setFormatter(FORMATTER)
 
-STREAM_HANDLER = logging.StreamHandler(stream=sys.stdout)
-STREAM_HANDLER.setLevel(LEVEL)  # Depends on DEBUG mode for terminal
-STREAM_HANDLER.setFormatter(FORMATTER)
+def setup():
+    """
+    Logs to a new timestamped file and to the terminal. Only called once the application actually launches, so that
+    importing the package does not create a log file.
+    """
+    file_name = str(Paths.LOGS_DIR / f"coronainfo_{datetime.now().strftime(Date.FILE_FORMAT)}.log")
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Base level
-    handlers=[
-        FILE_HANDLER,
-        STREAM_HANDLER
-    ]
-)
+    # The file is only opened once the first record is written
+    file_handler = logging.FileHandler(filename=file_name, mode="w", encoding="utf-8", delay=True)
+    file_handler.setLevel(logging.DEBUG)  # Always DEBUG for file
+    file_handler.setFormatter(FORMATTER)
 
-logging.debug(f"Log file: {FILE_NAME}")
+    stream_handler = logging.StreamHandler(stream=sys.stdout)
+    stream_handler.setLevel(LEVEL)  # Depends on DEBUG mode for terminal
+    stream_handler.setFormatter(FORMATTER)
+
+    logging.basicConfig(
+        level=logging.DEBUG,  # Base level
+        handlers=[
+            file_handler,
+            stream_handler
+        ]
+    )
+
+    logging.debug(f"Log file: {file_name}")
@@ -18,22 +18,24 @@
 import logging
 import sys
 
+from coronainfo.utils import profiling
+profiling.start()  # For entry points besides the launchers, which already started it before importing gi
+
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gio, Adw
+from gi.repository import Gio, Adw, Gtk
 
-# noinspection PyUnresolvedReferences
-from coronainfo import _logger  # Unused but is necessary to initialise the logger
-from coronainfo.enums import App
+from coronainfo import _logger
+from coronainfo.enums import App, Paths
 from coronainfo.settings import AppSettings
-from coronainfo.views import MainWindow, AboutDialog
 from coronainfo.utils.ui_helpers import create_action, log_action_call
 
 
 class CoronaInfoApp(Adw.Application):
-    _schema = Gio.Settings(schema_id=App.ID)
-    _settings = AppSettings.fetch_settings()
+    # Both are loaded on first use rather than on import, so the log and data directories exist by then
+    _schema: Gio.Settings = None
+    _settings: AppSettings = None
 
     def __init__(self):
         super().__init__(application_id=App.ID,
@@ -47,10 +49,14 @@ class CoronaInfoApp(Adw.Application):
 
     @classmethod
     def get_schema(cls) -> Gio.Settings:
+        if cls._schema is None:
+            cls._schema = Gio.Settings(schema_id=App.ID)
         return cls._schema
 
     @classmethod
-    def get_settings(cls) -> Gio.Settings:
+    def get_settings(cls) -> AppSettings:
+        if cls._settings is None:
+            cls._settings = AppSettings.fetch_settings()
         return cls._settings
 
     def on_activate(self, app):
@@ -58,17 +64,25 @@ class CoronaInfoApp(Adw.Application):
         logging.info("Preparing window")
         win = self.props.active_window
         if not win:
+            # The window pulls in the controllers and the data stack, which are not needed before activation
+            from coronainfo.views import MainWindow
+            profiling.mark("Window module imported")
+
             win = MainWindow(application=self)
             self.set_accels_for_action("win.show-help-overlay", ["<Ctrl>question"])
         win.present()
         logging.info("Window launched")
 
+        if profiling.ENABLED:
+            self._watch_first_frame(win)
+
     def on_shutdown(self, app):
         logging.info("Shutting down application")
-        self._settings.commit()
+        self.get_settings().commit()
 
     def on_about_action(self, action: Gio.SimpleAction, param):
         log_action_call(action)
+        from coronainfo.views import AboutDialog
         about = AboutDialog(self.props.active_window)
         about.present()
 
@@ -76,6 +90,17 @@ class CoronaInfoApp(Adw.Application):
         log_action_call(action)
         self.quit()
 
+    def _watch_first_frame(self, win: Gtk.Window):
+        frame_clock = win.get_frame_clock()
+        if frame_clock is None:
+            return
+
+        def on_after_paint(clock):
+            profiling.mark("First frame")
+            clock.disconnect(handler_id)
+
+        handler_id = frame_clock.connect("after-paint", on_after_paint)
+
 
 def get_schema() -> Gio.Settings:
     return CoronaInfoApp.get_schema()
@@ -86,5 +111,9 @@ def get_settings() -> AppSettings:
 
 
 def main(version):
+    Paths.ensure_dirs()
+    _logger.setup()
+    profiling.mark("Imports")
+
     app = CoronaInfoApp()
     return app.run(sys.argv)
@@ -1,15 +1,34 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import IO, Callable
 
-from bs4 import BeautifulSoup, Tag
 from gi.repository import GLib, GObject, Gio, Gtk
 
 from coronainfo import app
-from coronainfo.enums import App, Date, Paths
-from coronainfo.models import CoronaData, CoronaHeaders
-from coronainfo.utils.files import get_json, write_json
-from coronainfo.utils.functions import convert_to_num
-from coronainfo.utils.ui_helpers import run_in_thread, evaluate_title
+from coronainfo.enums import App, Paths
+from coronainfo.models import CoronaHeaders
+from coronainfo.models.model_list import CoronaListModel, CoronaRowItem
+from coronainfo.service import DataService
+from coronainfo.utils.diff import RowDiffer
+from coronainfo.utils.export import (
+    EXPORT_FORMATS, CsvWriter, ExportTable, export_history, export_table, format_for_path
+)
+from coronainfo.utils.formatting import render_row
+from coronainfo.utils.history import SnapshotStore
+from coronainfo.utils.search import CountrySearchIndex, bitset_rows, fold
+from coronainfo.utils.ui_helpers import IdleConsumer, foreground_attributes, run_in_thread, evaluate_title
+
+REFRESH_TIMEOUT = 60  # Seconds before a population is given up on, regardless of progress
+BATCH_SIZE = 50  # Rows handed over to the main loop at a time
+FILTER_DELAY = 150  # Milliseconds to wait for more search input before filtering
+TEXT_OFFSET = len(CoronaHeaders)  # Row index of the display text of the first field
+COLOUR_OFFSET = TEXT_OFFSET + len(CoronaHeaders)  # Row index of the foreground colour of the first field
+ROW_HEIGHT = 30
+EXPORT_SELECTIONS = {
+    "visible": "Visible rows and columns",
+    "all": "Every row and column",
+    "history": "Every snapshot in the history",
+}
 
 
 class MainController(GObject.Object):
@@ -23,49 +42,130 @@ class MainController(GObject.Object):
         super().__init__()
         self._setup_signals()
 
-        self.table: Gtk.TreeView = None
+        self.table: Gtk.ColumnView = None
+
+        # Every row holds the raw values, followed by the display text and foreground colour of every column
+        self.model = CoronaListModel(int(CoronaHeaders.COUNTRY))
+
+        self.service = DataService(app.get_settings(), self.update_progress, self._on_fetch_error)
+        self.search_index = CountrySearchIndex()
+        self._visible_rows: frozenset[int] = frozenset()
 
-        field_types = tuple(field.type for field in CoronaData.get_fields())
-        logging.debug(f"Model field types: {field_types}")
-        self.model = Gtk.ListStore(*field_types)
         self.country_filter = ""
-        self.set_filter(self.country_filter)
+        self.country_search = Gtk.CustomFilter.new(self.filter_func, None)
+        self.model_filter = Gtk.FilterListModel(model=self.model, filter=self.country_search)
+        # The sorter is the column view's own, so clicking a header sorts by that column. Sorting is incremental, so
+        # even large datasets are sorted a chunk at a time without blocking the main loop.
+        self.model_sort = Gtk.SortListModel(model=self.model_filter, incremental=True)
+        self._pending_filter = ""
+        self._filter_timeout_id = 0
 
         self.is_populating = False
+        self._cancellable: Gio.Cancellable = None
+        self._timeout_id = 0
+
+        self._auto_refresh_id = 0
+        app.get_schema().connect("changed::refresh-interval", self.on_refresh_interval_changed)
+        self._schedule_auto_refresh()
 
     def start_populate(self):
-        run_in_thread(self._populate_data, self.on_populate_finished)
+        self._start_populate(use_cache=True)
 
-    def on_populate_finished(self):
-        self.is_populating = False
-        self.emit(self.POPULATE_FINISHED)
+    def on_batch_ready(self, batch: list[tuple], differ: RowDiffer, cancellable: Gio.Cancellable):
+        if cancellable.is_cancelled():
+            return
+
+        # Only touch the rows that actually changed, so the view keeps its scroll position, selection and sorting
+        diff = differ.feed(batch)
+        for country, (columns, values) in diff.changed.items():
+            self.model.update_row(country, columns, values)
+        self.model.append_rows(diff.added)
+
+    def on_populate_finished(self, complete: bool, differ: RowDiffer, search_index: CountrySearchIndex,
+                             cancellable: Gio.Cancellable, revalidate: bool):
+        if cancellable is not self._cancellable or cancellable.is_cancelled():
+            # A cancelled population finishing late must not touch the state of the current one
+            logging.debug("Ignoring a cancelled data population")
+            return
+
+        if complete:
+            removed = differ.finish()
+            logging.debug(f"Removing {len(removed)} rows that no longer exist")
+            self.model.remove_keys(removed)
+            # Built by the worker from the fetched rows, which are now exactly the rows of the model
+            self.search_index = search_index
+        else:
+            logging.warning("Data population did not complete, keeping rows that were not updated")
+
+        self._update_visible_rows()
+        if self.country_filter:
+            self.country_search.changed(Gtk.FilterChange.DIFFERENT)
+
+        if self.model_sort.get_n_items() == 0:
+            self.emit(self.MODEL_EMPTY)
+
+        self._end_populate()
         logging.info("Data population finished")
 
-        # Update title
-        display = evaluate_title(app.get_settings())
-        self.update_progress(display)
+        # Whatever was cached is on screen by now, so a stale cache can be refreshed without anyone waiting on it
+        max_age = timedelta(minutes=app.get_schema().get_int("cache-max-age"))
+        if revalidate and self.service.is_stale(max_age):
+            logging.info(f"Cached data is older than {max_age}, refreshing in the background")
+            self._start_populate(use_cache=False, background=True)
 
     def on_refresh(self):
         if not self.is_populating:
-            self.model.clear()
-            run_in_thread(self._populate_data, self.on_populate_finished, func_args=(False,))
+            self._start_populate(use_cache=False)
         else:
             message = "Refresh in progress!"
             logging.warning(message)
             self.emit(self.TOAST_MESSAGE, message, 2)
 
+    def on_cancel_refresh(self):
+        if not self.is_populating:
+            return
+
+        logging.info("Cancelling data population")
+        self._cancellable.cancel()
+        self._end_populate()
+        self.emit(self.TOAST_MESSAGE, "Refresh cancelled", 2)
+
+    def on_auto_refresh(self):
+        if not self.is_populating:
+            logging.info("Refreshing data automatically")
+            self._start_populate(use_cache=False, background=True)
+
+        return GLib.SOURCE_CONTINUE
+
+    def on_refresh_interval_changed(self, settings: Gio.Settings, key: str):
+        self._schedule_auto_refresh()
+
+    def on_refresh_timeout(self, cancellable: Gio.Cancellable):
+        if cancellable is self._cancellable and self.is_populating:
+            message = f"Refresh timed out after {REFRESH_TIMEOUT} seconds"
+            logging.warning(message)
+            cancellable.cancel()
+            self._timeout_id = 0  # Removed by returning SOURCE_REMOVE
+            self._end_populate()
+            self.emit(self.TOAST_MESSAGE, message, 0)
+
+        return GLib.SOURCE_REMOVE
+
     def on_save(self, window: Gtk.ApplicationWindow):
         self._dialog = Gtk.FileChooserNative(
-            title="Save File as",
+            # The format follows the extension of the file name, as GTK cannot rename the file when a choice changes
+            title=f"Export Data ({', '.join(writer.extension for writer in EXPORT_FORMATS.values())})",
             transient_for=window,
             action=Gtk.FileChooserAction.SAVE,
-            accept_label="_Save",
+            accept_label="_Export",
             cancel_label="_Cancel"
         )
+        self._dialog.add_choice("selection", "Export", list(EXPORT_SELECTIONS), list(EXPORT_SELECTIONS.values()))
+        self._dialog.set_choice("selection", "visible")
 
         name = App.NAME.replace(' ', '')
         date = datetime.fromisoformat(app.get_settings().last_fetched).date()
-        file_name = f"{name}_{date}.json"
+        file_name = f"{name}_{date}{CsvWriter.extension}"
         downloads_dir = Gio.File.new_for_path(str(Paths.DOWNLOADS_DIR))
         self._dialog.set_current_name(file_name)
         self._dialog.set_current_folder(downloads_dir)
@@ -75,217 +175,239 @@ class MainController(GObject.Object):
     def on_save_response(self, dialog: Gtk.FileChooserNative, response: int):
         logging.debug(f"Response type: {Gtk.ResponseType(response).value_name}")
         if response == Gtk.ResponseType.ACCEPT:
-            dest_file: Gio.File = dialog.get_file()
-            logging.info(f"Saving data to {dest_file.get_path()}")
-            try:
-                src_file: Gio.File = Gio.File.new_for_path(str(Paths.CACHE_JSON))
-                logging.debug(f"Attempting to read file: {src_file.get_path()}")
-                src_file.load_contents_async(None, self.on_read_cache_complete, dest_file)
-
-            except GLib.Error as err:
-                logging.error("An error has occurred while trying to read from cache while saving:", exc_info=True)
-                self.emit(
-                    self.TOAST_MESSAGE,
-                    f"An error has occurred while attempting to save data. Refer the logs at {Paths.LOGS_DIR}",
-                    0)
+            path = dialog.get_file().get_path()
+            export_format = format_for_path(path, default=CsvWriter.name)
+            selection = dialog.get_choice("selection")
+            logging.info(f"Exporting {selection} data as {export_format} to {path}")
+
+            # What to export is decided on the main thread, the worker only streams it to the file
+            export = self._prepare_export(selection, export_format)
+            errors = []
+
+            def write():
+                try:
+                    if EXPORT_FORMATS[export_format].binary:
+                        file = open(path, "wb")
+                    else:
+                        file = open(path, "w", newline="", encoding="utf-8")
+                    with file:
+                        export(file)
+
+                except (OSError, ValueError) as err:
+                    logging.error("An error has occurred while exporting data:", exc_info=True)
+                    errors.append(err)
+
+            run_in_thread(write, self.on_export_finished, on_finish_args=(path, errors))
 
         self._dialog.destroy()
 
-    def on_read_cache_complete(self, file: Gio.File, result: Gio.AsyncResult, dest_file: Gio.File):
-        try:
-            contents = file.load_contents_finish(result)[1]
-            contents_bytes = GLib.Bytes.new(contents)
-            logging.debug(f"Attempting to write to file: {dest_file.get_path()}")
-            dest_file.replace_contents_bytes_async(
-                contents_bytes,
-                None,
-                False,
-                Gio.FileCreateFlags.NONE,
-                None,
-                self.on_write_file_complete
-            )
-
-        except GLib.Error as err:
-            logging.error("An error has occurred while trying to write data:", exc_info=True)
+    def on_export_finished(self, path: str, errors: list):
+        if errors:
             self.emit(
                 self.TOAST_MESSAGE,
                 f"An error has occurred while attempting to save data. Refer the logs at {Paths.LOGS_DIR}",
                 0)
-
-    def on_write_file_complete(self, file: Gio.File, result: Gio.AsyncResult):
-        result = file.replace_contents_finish(result)
-        path = file.get_path()
-
-        if not result:
-            logging.warning(f"Unable to save data to {path}")
             return
 
         message = f"Successfully saved data to {path}"
         logging.info(message)
         self.emit(self.TOAST_MESSAGE, message, 2)
 
-    def set_table(self, table: Gtk.TreeView):
+    def _prepare_export(self, selection: str, export_format: str) -> Callable[[IO], None]:
+        if selection == "history":
+            # A store of its own, the service's store may be appended to while the export runs
+            store = SnapshotStore(Paths.HISTORY_DIR)
+            return lambda file: export_history(store, file, export_format)
+
+        if selection == "visible":
+            # The rows the search leaves, in the order they are sorted in
+            rows = [self.model_sort.get_item(i).row for i in range(self.model_sort.get_n_items())]
+            fields = [i for i, column in enumerate(self.get_columns()) if column.get_visible()]
+        else:
+            rows = self.model.rows()
+            fields = None
+
+        if EXPORT_FORMATS[export_format].all_fields:
+            fields = None
+
+        # Rows only hold references to their values, which are read straight out of them while writing
+        table = ExportTable.from_rows(rows, fields)
+        return lambda file: export_table(table, file, export_format)
+
+    def set_table(self, table: Gtk.ColumnView):
         self.table = table
 
         # Set columns
         for i, header in enumerate(CoronaHeaders.as_tuple()):
             title = header.replace("_", " ").replace("PER", "/").title()
-            renderer = Gtk.CellRendererText()
-            renderer.set_property("height", 30)
-
-            column = Gtk.TreeViewColumn(title, renderer, text=i)
-            column.set_cell_data_func(renderer, self.cell_data_func, func_data=i)
-            column.set_alignment(0.5)
-            column.set_sort_column_id(i)
-            column.set_expand(True)
+
+            # Only rows in view get a widget, which is rebound to other rows while scrolling
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", self.on_cell_setup)
+            factory.connect("bind", self.on_cell_bind, i)
+
+            # Display text and colour are rendered once per row when it is ingested, sorting uses the raw value
+            sorter = Gtk.CustomSorter.new(self.compare_func, i)
+            column = Gtk.ColumnViewColumn(title=title, factory=factory, sorter=sorter, expand=True)
             self._bind_column_settings(column)
 
             self.table.append_column(column)
 
-    def cell_data_func(self, column: Gtk.TreeViewColumn,
-                       renderer: Gtk.CellRendererText,
-                       model: Gtk.TreeModelSort,
-                       tree_iter: Gtk.TreeIter,
-                       data):  # column number
-
-        value = model.get(tree_iter, data)[0]
-        if isinstance(value, int):
-            display = f"{value:,}"
-
-            if "NEW" in CoronaHeaders.as_tuple()[data]:
-                prefix = ""
-                if value >= 0:
-                    prefix = "+"
-                display = prefix + display
-
-            renderer.set_property("text", display)
-
-        orange = "rgb(255, 145, 0)"
-        red = "rgb(220, 0, 0)"
-        green = "rgb(0, 160, 0)"
-        blue = "rgb(82, 119, 145)"
-        if data == int(CoronaHeaders.NEW_CASES):
-            colour = orange
-            if value < 0:
-                colour = blue
-            renderer.set_property("foreground", colour)
-
-        if data == int(CoronaHeaders.NEW_DEATHS):
-            colour = red
-            if value < 0:
-                colour = blue
-            renderer.set_property("foreground", colour)
-
-        if data == int(CoronaHeaders.NEW_RECOVERED):
-            colour = green
-            if value < 0:
-                colour = red
-            renderer.set_property("foreground", colour)
+        # The list models live as long as the table, searching only refilters them
+        self.model_sort.set_sorter(self.table.get_sorter())
+        self.table.set_model(Gtk.SingleSelection(model=self.model_sort))
+
+    def get_columns(self) -> list[Gtk.ColumnViewColumn]:
+        columns = self.table.get_columns()
+        return [columns.get_item(i) for i in range(columns.get_n_items())]
+
+    def on_cell_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem):
+        label = Gtk.Label(height_request=ROW_HEIGHT)
+        list_item.set_child(label)
+
+    def on_cell_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem, column: int):
+        row = list_item.get_item().row
+        label: Gtk.Label = list_item.get_child()
+        label.set_text(row[TEXT_OFFSET + column])
+        label.set_attributes(foreground_attributes(row[COLOUR_OFFSET + column]))
+
+    def compare_func(self, item1: CoronaRowItem, item2: CoronaRowItem, column: int) -> Gtk.Ordering:
+        value1 = item1.row[column]
+        value2 = item2.row[column]
+        return Gtk.Ordering((value1 > value2) - (value1 < value2))
 
     def set_filter(self, text: str):
-        if self.table:
-            self.country_filter = text
-            model_filter: Gtk.TreeModelFilter = self.model.filter_new()
-            model_filter.set_visible_func(self.visible_func)
-            model_proxy: Gtk.TreeModelSort = Gtk.TreeModelSort.new_with_model(model_filter)
-            self.table.set_model(model_proxy)
+        # Debounce search input: only the last text entered within the delay gets applied
+        self._pending_filter = text
+        if self._filter_timeout_id:
+            GLib.source_remove(self._filter_timeout_id)
+        self._filter_timeout_id = GLib.timeout_add(FILTER_DELAY, self.on_filter_timeout)
 
-            if len(model_proxy) == 0:
-                self.emit(self.MODEL_EMPTY)
+    def on_filter_timeout(self):
+        self._filter_timeout_id = 0
+        self.country_filter = self._pending_filter
+        self._update_visible_rows()
+        self.country_search.changed(Gtk.FilterChange.DIFFERENT)
 
-    def visible_func(self, model: Gtk.ListStore, tree_iter: Gtk.TreeIter, data):
+        if self.model_sort.get_n_items() == 0:
+            self.emit(self.MODEL_EMPTY)
+
+        return GLib.SOURCE_REMOVE
+
+    def filter_func(self, item: CoronaRowItem, data):
         if not self.country_filter:
             return True
 
-        country = model[tree_iter][int(CoronaHeaders.COUNTRY)]
-        return self.country_filter.lower() in country.lower()
+        country = item.row[int(CoronaHeaders.COUNTRY)]
+        row = self.search_index.rows.get(country)
+        if row is None:
+            # Added since the index was last rebuilt
+            return fold(self.country_filter) in fold(country)
+        return row in self._visible_rows
 
-    def update_progress(self, message: str):
-        # TODO: look into fixing the 'Trying to snapshot XXX without a current allocation' error
-        self.emit(self.PROGRESS_MESSAGE, message)
+    def _update_visible_rows(self):
+        # Decoded into a set once per search, so the filter looks every row up in constant time
+        if not self.country_filter:
+            self._visible_rows = frozenset()  # Not consulted without a filter
+        else:
+            # Always searched in memory, even with a database: the index holds exactly the rows on screen, and the
+            # database is locked while a worker stores a snapshot
+            self._visible_rows = bitset_rows(self.search_index.query(self.country_filter))
 
-    def _populate_data(self, use_cache: bool = True):
-        self.emit(self.POPULATE_STARTED)
-        self.is_populating = True
-        logging.info("Data population started")
+    def update_progress(self, message: str):
+        # Progress is reported from the worker thread, so the signal is always emitted from the main loop
+        self._emit_idle(self.PROGRESS_MESSAGE, message)
 
-        self.table.set_model(None)
-        for row in self._get_data(use_cache=use_cache):
-            self.model.append(row)
-        self.set_filter(self.country_filter)
-
-    def _get_data(self, use_cache: bool = True):
-        cache_file = Paths.CACHE_JSON
-
-        if not cache_file.exists() or not use_cache:
-            message = "Fetching data..."
-            self.update_progress(message)
-            logging.info(message)
-            dataset = self._fetch_data()
-            logging.debug(f"Caching data at {cache_file}")
-            write_json(cache_file, [row.as_dict() for row in dataset])
-
-            # Update last_fetched settings
-            today = datetime.now().strftime(Date.RAW_FORMAT)
-            logging.debug(f"Updating last_fetched: {today}")
-            settings = app.get_settings()
-            settings.last_fetched = today
-
-        message = "Reading data..."
-        self.update_progress(message)
-        logging.info(message)
-        json_data = get_json(cache_file)
-        result = map(lambda row: CoronaData(**row), json_data)
-        return result
+    def _emit_idle(self, signal: str, *args):
+        def emit():
+            self.emit(signal, *args)
+            return GLib.SOURCE_REMOVE
 
-    def _fetch_data(self) -> map:
-        fetch_url: Gio.File = Gio.File.new_for_uri("https://www.worldometers.info/coronavirus/")
-        try:
-            success, content, etag = fetch_url.load_contents(None)
-
-            # Parse html content and find the table for today
-            logging.info("Parsing fetched data...")
-            soup = BeautifulSoup(content, "html.parser")
-            table = soup.find(id="main_table_countries_today")
-            table_body = table.find("tbody")
-
-            message = "Parsing table HTML..."
-            self.update_progress(message)
-            logging.info(message)
-            result = self._parse_table_html(table_body)
-            return result
-
-        except GLib.Error as err:
-            logging.error("An error has occurred while fetching data:", exc_info=True)
-            self.emit(
-                self.TOAST_MESSAGE,
-                f"An error has occurred while fetching data. Refer the logs at {Paths.LOGS_DIR}",
-                0)
+        GLib.idle_add(emit)
 
-    def _parse_table_html(self, table: Tag) -> map:
-        countries: list[Tag] = table.find_all("tr")[7:]
-        result = map(lambda country: sanitise_row(country), countries)
+    def _start_populate(self, use_cache: bool, background: bool = False):
+        # A background population keeps the current rows on screen and applies the changes once they arrive
+        self.is_populating = True
+        self.emit(self.POPULATE_STARTED, background)
+        logging.info("Data population started")
 
-        def sanitise_row(clean_row: Tag):
-            row_data = clean_row.find_all("td")[1:15]
-            sanitised_row = map(lambda value: sanitise_value(value.text), row_data)
-            clean_row = CoronaData(*sanitised_row)
+        # Every population gets its own cancellable, so cancelling one never affects the next
+        cancellable = Gio.Cancellable()
+        self._cancellable = cancellable
+        self._timeout_id = GLib.timeout_add_seconds(REFRESH_TIMEOUT, self.on_refresh_timeout, cancellable)
+
+        # Snapshot the current rows on the main thread, the worker never touches the model
+        differ = RowDiffer(self.model.rows_by_key(), self.model.key_column)
+        search_index = CountrySearchIndex()
+        consumer = IdleConsumer(
+            lambda batch: self.on_batch_ready(batch, differ, cancellable),
+            lambda complete: self.on_populate_finished(
+                complete, differ, search_index, cancellable, use_cache and not background
+            )
+        )
+        run_in_thread(
+            self._populate_data,
+            func_args=(use_cache, cancellable, consumer, search_index),
+            cancellable=cancellable
+        )
 
-            return clean_row
+    def _end_populate(self):
+        self.is_populating = False
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = 0
 
-        def sanitise_value(value: str):
-            sanitised_value = value.replace(",", "").strip()
+        self.emit(self.POPULATE_FINISHED)
 
-            if sanitised_value == "N/A":
-                sanitised_value = None
+        # Update title
+        display = evaluate_title(app.get_settings())
+        self.update_progress(display)
 
-            clean_value = convert_to_num(sanitised_value)
-            if isinstance(clean_value, float):
-                clean_value = int(clean_value)
+    def _schedule_auto_refresh(self):
+        if self._auto_refresh_id:
+            GLib.source_remove(self._auto_refresh_id)
+            self._auto_refresh_id = 0
 
-            return clean_value
+        minutes = app.get_schema().get_int("refresh-interval")
+        if minutes > 0:
+            logging.debug(f"Refreshing data automatically every {minutes} minutes")
+            self._auto_refresh_id = GLib.timeout_add_seconds(minutes * 60, self.on_auto_refresh)
 
-        return result
+    def _populate_data(self, use_cache: bool, cancellable: Gio.Cancellable, consumer: IdleConsumer,
+                       search_index: CountrySearchIndex):
+        # Runs on the worker thread: rows are handed over to the main loop in batches
+        complete = False
+        try:
+            batch = []
+            countries = []
+            for row in self.service.get_data(use_cache, cancellable):
+                if cancellable.is_cancelled():
+                    break
+
+                values = row.as_tuple()
+                batch.append(values + render_row(values))
+                countries.append(values[int(CoronaHeaders.COUNTRY)])
+                if len(batch) >= BATCH_SIZE:
+                    consumer.put(batch)
+                    batch = []
+
+            if batch:
+                consumer.put(batch)
+
+            # Built here rather than on the main loop, the index only takes effect once every row has arrived
+            if not cancellable.is_cancelled():
+                search_index.rebuild(countries)
+                complete = True
+
+        finally:
+            consumer.close(complete)
+
+    def _on_fetch_error(self, error: BaseException):
+        # Reported by the service from the worker thread, after it has logged the error
+        self._emit_idle(
+            self.TOAST_MESSAGE,
+            f"An error has occurred while fetching data. Refer the logs at {Paths.LOGS_DIR}",
+            0)
 
     def _setup_signals(self):
         GObject.signal_new(
@@ -293,7 +415,7 @@ class MainController(GObject.Object):
             self,  # A Python GObject instance or type that the signal is associated with
             GObject.SignalFlags.RUN_LAST,  # Signal flags
             GObject.TYPE_BOOLEAN,  # Return type of the signal handler
-            []  # Parameter types
+            [bool]  # Parameter types: whether the population runs in the background
         )
 
         GObject.signal_new(
@@ -328,7 +450,7 @@ class MainController(GObject.Object):
             [str, int]
         )
 
-    def _bind_column_settings(self, column: Gtk.TreeViewColumn):
+    def _bind_column_settings(self, column: Gtk.ColumnViewColumn):
         title = column.get_title()
         name = title.replace(" ", "-").replace("/", "per").lower()
 
@@ -16,8 +16,11 @@ class Paths:
 
     _xdg_cache = os.environ.get("XDG_CACHE_HOME")
     CACHE_DIR = Path(_xdg_cache) if _xdg_cache else Path.home() / ".cache" / App.ID
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     CACHE_JSON = CACHE_DIR / "cache.json"
+    CACHE_BIN = CACHE_DIR / "cache.bin"
+    HISTORY_DIR = CACHE_DIR / "history"
+    CACHE_DB = CACHE_DIR / "cache.db"
+    CACHE_META_JSON = CACHE_DIR / "cache_meta.json"
 
     _xdg_data = os.environ.get("XDG_DATA_HOME")
     DATA_DIR = Path(_xdg_data) if _xdg_data else CACHE_DIR
@@ -26,10 +29,15 @@ class Paths:
     _xdg_state = os.environ.get("XDG_STATE_HOME")
     STATE_DIR = Path(_xdg_state) if _xdg_state else DATA_DIR
     LOGS_DIR = STATE_DIR / "logs"
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
     DOWNLOADS_DIR = Path.home() / "Downloads"
 
+    @classmethod
+    def ensure_dirs(cls):
+        # Called by the entry points rather than on import, so importing a module never touches the filesystem
+        for directory in (cls.CACHE_DIR, cls.DATA_DIR, cls.LOGS_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
+
 
 class Date:
     RAW_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -1 +1,2 @@
 from .model_corona import CoronaData, CoronaHeaders
+from .model_dataset import CoronaDataset, CoronaRow
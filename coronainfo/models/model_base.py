@@ -1,5 +1,5 @@
 import typing
-from dataclasses import Field, astuple, fields, asdict
+from dataclasses import MISSING, Field, asdict, fields
 from enum import Enum
 from typing import Iterable
 
@@ -11,45 +11,48 @@ class BaseData:
     def get_fields(cls) -> tuple[Field]:
         return fields(cls)
 
-    def as_tuple(self):
-        return astuple(self)
+    @classmethod
+    def get_field_names(cls) -> tuple[str]:
+        return cls._get_spec().names
 
-    def as_dict(self):
-        return asdict(self)
+    @classmethod
+    def from_trusted(cls, *args, **kwargs):
+        """
+        Creates an instance without running `__init__` or any type checking. Only use this for data that is known
+        to be valid, such as data that this application has serialised itself.
+        """
+        spec = cls._get_spec()
+        instance = object.__new__(cls)
+        if args:
+            kwargs.update(zip(spec.names, args))
+        instance.__dict__ = {**spec.defaults, **kwargs} if spec.defaults else kwargs
+        return instance
 
-    def __post_init__(self):
-        self._tuple = astuple(self)
+    @classmethod
+    def _get_spec(cls) -> "_DataSpec":
+        # Looked up in the class' own namespace, so subclasses never reuse the spec of their parent
+        spec = cls.__dict__.get("_spec")
+        if spec is None:
+            spec = _DataSpec(cls)
+            cls._spec = spec
 
-        # Type checking
-        for field in fields(self):
-            field_value = self.__dict__[field.name]
-            field_type = field.type
+        return spec
 
-            # Validate subtypes
-            if isinstance(field_value, Iterable) and type(field_value) is not str:
-                sub_types = typing.get_args(field_type)  # get the 'int' from list[int] etc.
-                sub_types = spread_subtypes(sub_types)
-                if sub_types:
-                    field_type = typing.get_origin(field_type)  # get the 'list' from list[int] etc.
+    def as_tuple(self):
+        values = self.__dict__
+        return tuple(values[name] for name in self._get_spec().names)
 
-                for item in field_value:
-                    if type(item) not in sub_types:
-                        raise TypeError(
-                            f"The field '{field.name}' with value(s) '{field_value}' contains one or more items "
-                            f"that are not {sub_types}"
-                        )
+    def as_dict(self):
+        return asdict(self)
 
-            if not type(field_value) == field_type:
-                raise TypeError(
-                    f"The field '{field.name}' with value '{getattr(self, field.name)}' is not of type "
-                    f"{field.type}"
-                )
+    def __post_init__(self):
+        self._get_spec().validate(self)
 
     def __getitem__(self, item: typing.Union[int, str]):
         # Make this accessible by subscripting.
         # Example: bruh_data[0] or bruh_data["attribute"]
         if type(item) is int:
-            return self._tuple[item]
+            return self.__dict__[self._get_spec().names[item]]
         elif type(item) is str:
             return getattr(self, item)
 
@@ -57,7 +60,52 @@ class BaseData:
         setattr(self, key, value)
 
     def __len__(self):
-        return len(self._tuple)
+        return len(self._get_spec().names)
+
+
+class _DataSpec:
+    """
+    Everything needed to construct and type check instances of a dataclass, worked out once per class from its
+    fields. Fields with plain types are checked with a single identity comparison. Only fields with subscripted
+    types, like list[int], check their items.
+    """
+
+    def __init__(self, cls: type):
+        self.names = tuple(field.name for field in fields(cls))
+        self.defaults = {
+            field.name: field.default for field in fields(cls) if field.default is not MISSING
+        }
+
+        self.simple_fields: list[tuple[str, type]] = []
+        self.generic_fields: list[tuple[str, typing.Any, type, tuple]] = []
+        for field in fields(cls):
+            sub_types = spread_subtypes(typing.get_args(field.type))  # get the 'int' from list[int] etc.
+            if sub_types:
+                origin = typing.get_origin(field.type)  # get the 'list' from list[int] etc.
+                self.generic_fields.append((field.name, field.type, origin, sub_types))
+            else:
+                self.simple_fields.append((field.name, field.type))
+
+    def validate(self, instance: BaseData):
+        values = instance.__dict__
+        for name, field_type in self.simple_fields:
+            if type(values[name]) is not field_type:
+                raise TypeError(f"The field '{name}' with value '{values[name]}' is not of type {field_type}")
+
+        for name, field_type, origin, sub_types in self.generic_fields:
+            field_value = values[name]
+            if isinstance(field_value, Iterable) and type(field_value) is not str:
+                for item in field_value:
+                    if type(item) not in sub_types:
+                        raise TypeError(
+                            f"The field '{name}' with value(s) '{field_value}' contains one or more items "
+                            f"that are not {sub_types}"
+                        )
+
+                if type(field_value) is origin:
+                    continue
+
+            raise TypeError(f"The field '{name}' with value '{field_value}' is not of type {field_type}")
 
 
 class BaseEnum(Enum):
@@ -0,0 +1,101 @@
+import sys
+from array import array
+from typing import Iterable, Iterator, MutableSequence, Sequence, Union
+
+from coronainfo.models.model_corona import CoronaData, CoronaHeaders
+
+FIELD_NAMES = tuple(field.name for field in CoronaData.get_fields())
+NUMERIC_FIELDS = FIELD_NAMES[1:]  # Every field besides the country is an int
+
+
+class CoronaDataset:
+    """
+    A column-oriented collection of `CoronaData` rows. Countries are kept as a list of interned strings and every
+    numeric field as its own packed int64 column, so a row costs 8 bytes per number instead of a whole dataclass
+    instance. Indexing or iterating returns lightweight `CoronaRow` views.
+    """
+
+    def __init__(self, countries: MutableSequence[str] = None, columns: Sequence[MutableSequence[int]] = None):
+        self.countries = countries if countries is not None else []
+        self.columns = list(columns) if columns is not None else [array("q") for _ in NUMERIC_FIELDS]
+
+        if len(self.columns) != len(NUMERIC_FIELDS):
+            raise ValueError(f"Expected {len(NUMERIC_FIELDS)} numeric columns, got {len(self.columns)}")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]):
+        dataset = cls()
+        for row in rows:
+            dataset.append(row)
+        return dataset
+
+    def append(self, row: Sequence):
+        self.countries.append(sys.intern(row[0]))
+        for i, column in enumerate(self.columns, start=1):
+            column.append(row[i])
+
+    def column(self, key: Union[int, str, CoronaHeaders]) -> Sequence:
+        """
+        Returns a whole column, either by its index, field name or header.
+        """
+        if isinstance(key, CoronaHeaders):
+            key = int(key)
+        elif isinstance(key, str):
+            key = FIELD_NAMES.index(key)
+
+        return self.countries if key == 0 else self.columns[key - 1]
+
+    def row_tuple(self, index: int) -> tuple:
+        return (self.countries[index], *(column[index] for column in self.columns))
+
+    def __getitem__(self, index: int) -> "CoronaRow":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+
+        return CoronaRow(self, index)
+
+    def __iter__(self) -> Iterator["CoronaRow"]:
+        return (CoronaRow(self, index) for index in range(len(self)))
+
+    def __len__(self):
+        return len(self.countries)
+
+
+class CoronaRow:
+    """
+    A view of a single row of a `CoronaDataset` that can be subscripted like `CoronaData`.
+    """
+    __slots__ = ("dataset", "index")
+
+    def __init__(self, dataset: CoronaDataset, index: int):
+        self.dataset = dataset
+        self.index = index
+
+    def as_tuple(self) -> tuple:
+        return self.dataset.row_tuple(self.index)
+
+    def as_dict(self) -> dict:
+        return dict(zip(FIELD_NAMES, self.as_tuple()))
+
+    def __getitem__(self, item: Union[int, str]):
+        if type(item) is str:
+            item = FIELD_NAMES.index(item)
+        return self.dataset.column(item)[self.index]
+
+    def __getattr__(self, name: str):
+        if name in FIELD_NAMES:
+            return self[name]
+        raise AttributeError(name)
+
+    def __len__(self):
+        return len(FIELD_NAMES)
+
+    def __eq__(self, other):
+        if isinstance(other, (CoronaRow, CoronaData)):
+            return self.as_tuple() == other.as_tuple()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CoronaRow({', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())})"
@@ -0,0 +1,89 @@
+import weakref
+from typing import Iterable, Sequence, Union
+
+from gi.repository import GObject, Gio
+
+
+class CoronaRowItem(GObject.Object):
+    """
+    A single row of a `CoronaListModel`. Items only hold a reference to their row, and are only created when a view
+    asks for them.
+    """
+    __gtype_name__ = "CoronaRowItem"
+
+    def __init__(self, row: tuple):
+        super().__init__()
+        self.row = row
+
+
+class CoronaListModel(GObject.Object, Gio.ListModel):
+    """
+    A list model over plain row tuples. Rows are kept in a list, and an item is only created for a row while
+    something holds on to it, so the model never keeps one GObject per row around by itself.
+
+    Rows are identified by their key column, so updates coming from a `RowDiffer` can be applied in place.
+    """
+    __gtype_name__ = "CoronaListModel"
+
+    def __init__(self, key_column: int = 0):
+        super().__init__()
+        self.key_column = key_column
+
+        self._rows: list[tuple] = []
+        self._positions: dict[str, int] = {}
+        self._items: weakref.WeakValueDictionary[str, CoronaRowItem] = weakref.WeakValueDictionary()
+
+    def do_get_item_type(self) -> GObject.GType:
+        return CoronaRowItem.__gtype__
+
+    def do_get_n_items(self) -> int:
+        return len(self._rows)
+
+    def do_get_item(self, position: int) -> Union[CoronaRowItem, None]:
+        if position >= len(self._rows):
+            return None
+
+        row = self._rows[position]
+        key = row[self.key_column]
+        item = self._items.get(key)
+        if item is None:
+            item = CoronaRowItem(row)
+            self._items[key] = item
+        return item
+
+    def append_rows(self, rows: Iterable[tuple]):
+        start = len(self._rows)
+        for row in rows:
+            self._positions[row[self.key_column]] = len(self._rows)
+            self._rows.append(row)
+
+        added = len(self._rows) - start
+        if added:
+            self.items_changed(start, 0, added)
+
+    def update_row(self, key: str, columns: Sequence[int], values: Sequence):
+        position = self._positions[key]
+        row = list(self._rows[position])
+        for column, value in zip(columns, values):
+            row[column] = value
+        self._rows[position] = tuple(row)
+
+        # Views only rebind rows whose item changed, so the old item must not be handed out again
+        self._items.pop(key, None)
+        self.items_changed(position, 1, 1)
+
+    def remove_keys(self, keys: Iterable[str]):
+        positions = sorted((self._positions[key] for key in keys), reverse=True)
+        for position in positions:
+            row = self._rows.pop(position)
+            self._items.pop(row[self.key_column], None)
+            self.items_changed(position, 1, 0)
+
+        if positions:
+            self._positions = {row[self.key_column]: i for i, row in enumerate(self._rows)}
+
+    def rows(self) -> list[tuple]:
+        return list(self._rows)
+
+    def rows_by_key(self) -> dict[str, tuple]:
+        return {row[self.key_column]: row for row in self._rows}
@@ -0,0 +1,217 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Union
+
+from coronainfo.enums import Date, Paths
+from coronainfo.models import CoronaData, CoronaDataset
+from coronainfo.settings import AppSettings
+from coronainfo.utils.fetch import CacheValidators, Cancellable, FetchCancelled, WORLDOMETERS_URL
+from coronainfo.utils.files import backup_path, get_json, write_json
+from coronainfo.utils.history import SnapshotStore
+from coronainfo.utils.snapshot import SnapshotError, load_snapshot, write_snapshot
+
+
+class DataService:
+    """
+    The fetch, parse and cache pipeline, without any dependency on GTK, so it can run headless as well as behind the
+    UI. Progress messages and fetch errors are reported through optional callbacks, which are called on whichever
+    thread the pipeline runs on.
+    """
+
+    def __init__(self, settings: AppSettings, on_progress: Callable[[str], None] = None,
+                 on_error: Callable[[BaseException], None] = None):
+        self.settings = settings
+        self.on_progress = on_progress
+        self.on_error = on_error
+
+        self.history = SnapshotStore(Paths.HISTORY_DIR)
+        self.database = None
+        if settings.storage_backend == "sqlite":
+            from coronainfo.utils.database import SqliteStore
+            self.database = SqliteStore(Paths.CACHE_DB)
+
+    def get_data(self, use_cache: bool = True, cancellable: Cancellable = None) -> Iterable:
+        """
+        Returns the rows of today's table, fetching them first if no copy of the cache can be read or the cache should
+        not be used. Falls back to the cache if fetching fails.
+        """
+        if use_cache:
+            try:
+                self._report_progress("Reading data...")
+                return self.read_cache()
+            except (OSError, ValueError) as err:
+                logging.info(f"No usable cache, fetching instead: {err}")
+
+        data = self.refresh(cancellable)
+        if data is not None:
+            return data
+
+        if cancellable is not None and cancellable.is_cancelled():
+            return ()
+
+        self._report_progress("Reading data...")
+        return self.read_cache()
+
+    def cache_age(self) -> Union[timedelta, None]:
+        """
+        Returns how long ago the cached data was fetched, or None if there is no cache.
+        """
+        if not self.settings.last_fetched or not self.has_cache():
+            return None
+        return datetime.now() - datetime.fromisoformat(self.settings.last_fetched)
+
+    def has_cache(self) -> bool:
+        """
+        Returns whether there is any copy of the cache that `read_cache` could fall back to.
+        """
+        if self.database and self.database.latest_snapshot() is not None:
+            return True
+
+        paths = (Paths.CACHE_BIN, Paths.CACHE_JSON)
+        return any(path.exists() or backup_path(path).exists() for path in paths) or bool(self.history.entries())
+
+    def is_stale(self, max_age: timedelta) -> bool:
+        age = self.cache_age()
+        return age is None or age > max_age
+
+    def refresh(self, cancellable: Cancellable = None) -> Union[Iterable, None]:
+        """
+        Fetches every source, caching today's table and recording every table in the history.
+
+        Returns
+        -------
+        Iterable | None
+            The rows of today's table, read back from the cache if the page has not changed since the last fetch, or
+            None if fetching failed or was cancelled.
+        """
+        # The fetching and parsing stack is only loaded once it is needed, a fresh cache never needs it
+        from coronainfo.utils.scheduler import FetchScheduler, SOURCES, TODAY_SOURCE
+
+        self._report_progress("Fetching data...")
+        validators = CacheValidators.fetch_validators()
+        now = datetime.now()
+        today = now.strftime(Date.RAW_FORMAT)
+        dataset = None
+        fetched = False
+        errors = set()
+
+        # Every page is fetched and parsed on its own worker, results arrive as each one completes
+        scheduler = FetchScheduler(backend=self.settings.parser_backend)
+        for result in scheduler.run(SOURCES, {WORLDOMETERS_URL: validators}, cancellable):
+            if isinstance(result.error, FetchCancelled):
+                logging.info(f"Fetching {result.source.name} was cancelled")
+            elif result.error:
+                # Sources sharing a page share its error, which only needs to be reported once
+                if result.error not in errors:
+                    errors.add(result.error)
+                    self._report_error(result.error)
+            elif result.not_modified:
+                logging.info(f"Table for {result.source.name} has not changed since the last fetch, skipping parsing")
+                fetched = True
+            elif not result.dataset:
+                # Nothing worth replacing the cache or recording in the history with
+                logging.warning(f"Table for {result.source.name} has no rows, skipping it")
+            elif result.source is not TODAY_SOURCE:
+                # The tables of previous days come with the same download, and are kept as their own snapshots, once
+                fetched_on = now - timedelta(days=result.source.days_ago)
+                if self.history.on_date(fetched_on.date()) is not None:
+                    logging.debug(f"Table for {result.source.name} is already in the history, skipping it")
+                else:
+                    self.record_history(fetched_on.strftime(Date.RAW_FORMAT), result.dataset)
+            else:
+                try:
+                    dataset = result.dataset
+                    self.write_cache(dataset)
+                    result.validators.commit()
+                    self.record_history(today, dataset)
+                    fetched = True
+
+                except OSError as err:
+                    self._report_error(err)
+
+        if not fetched:
+            return None
+
+        # Update last_fetched settings
+        logging.debug(f"Updating last_fetched: {today}")
+        self.settings.last_fetched = today
+
+        if dataset is not None:
+            # No need to read back what was just parsed
+            return dataset
+
+        self._report_progress("Reading data...")
+        return self.read_cache()
+
+    def read_cache(self) -> Iterable:
+        """
+        Returns the cached rows of today's table. Every copy of the cache is checksummed, and a corrupted or missing
+        copy falls back to the next one: the binary cache, the JSON cache, the previous version of each, and lastly the
+        most recent snapshot in the history.
+
+        Raises
+        ------
+        OSError | ValueError
+            The error of the last fallback, if no copy of the cache could be read.
+        """
+        if self.database:
+            snapshot_id = self.database.latest_snapshot()
+            if snapshot_id is not None:
+                return self.database.get_snapshot(snapshot_id)
+
+        for path in (Paths.CACHE_BIN, backup_path(Paths.CACHE_BIN)):
+            try:
+                # Memory-mapped, so rows are only copied out of the file as they are accessed
+                return load_snapshot(path)
+            except (OSError, SnapshotError) as err:
+                logging.warning(f"Unable to load the binary cache at {path}: {err}")
+
+        for path in (Paths.CACHE_JSON, backup_path(Paths.CACHE_JSON)):
+            try:
+                json_data = get_json(path)
+                # The cache is only ever written by this application, so it does not need to be type checked again
+                return [CoronaData.from_trusted(**row) for row in json_data]
+            except (OSError, ValueError, TypeError) as err:
+                logging.warning(f"Unable to load the JSON cache at {path}: {err}")
+                error = err
+
+        try:
+            dataset = self.history.latest(verify=True)
+        except (OSError, SnapshotError) as err:
+            logging.warning(f"Unable to load the latest snapshot from the history: {err}")
+            dataset = None
+
+        if dataset is None:
+            raise error
+
+        logging.warning("Every copy of the cache is unusable, falling back to the latest snapshot in the history")
+        return dataset
+
+    def write_cache(self, dataset: CoronaDataset):
+        # Both copies keep their previous version, so one interrupted write never leaves no usable cache behind
+        logging.debug(f"Caching data at {Paths.CACHE_JSON}")
+        write_json(Paths.CACHE_JSON, [row.as_dict() for row in dataset], backup=True)
+        write_snapshot(Paths.CACHE_BIN, dataset, backup=True)
+
+    def record_history(self, fetched: str, dataset: CoronaDataset):
+        # Losing one snapshot of history is no reason to fail the whole population
+        try:
+            self.history.append(fetched, dataset)
+        except OSError as err:
+            logging.error("An error has occurred while recording history:", exc_info=True)
+
+        if self.database:
+            try:
+                self.database.add_snapshot(fetched, dataset)
+            except self.database.Error as err:
+                logging.error("An error has occurred while recording history in the database:", exc_info=True)
+
+    def _report_progress(self, message: str):
+        logging.info(message)
+        if self.on_progress:
+            self.on_progress(message)
+
+    def _report_error(self, error: BaseException):
+        logging.error("An error has occurred while fetching data:", exc_info=error)
+        if self.on_error:
+            self.on_error(error)
@@ -3,17 +3,19 @@ from dataclasses import dataclass
 
 from coronainfo.enums import Paths
 from coronainfo.models.model_base import BaseData
-from coronainfo.utils.files import get_json, write_json
+from coronainfo.utils.files import get_json_or_backup, write_json
 
 
 @dataclass
 class AppSettings(BaseData):
     last_fetched: str
+    parser_backend: str = "streaming"  # parsers.DEFAULT_BACKEND, not imported as that would load every parser
+    storage_backend: str = "files"  # Either "files" or "sqlite"
 
     @classmethod
     def fetch_settings(cls):
         try:
-            settings = cls(**get_json(Paths.SETTINGS_JSON))
+            settings = cls(**get_json_or_backup(Paths.SETTINGS_JSON))
             logging.debug(f"App settings: {settings}")
             return settings
 
@@ -33,4 +35,5 @@ class AppSettings(BaseData):
     def commit(self):
         path = Paths.SETTINGS_JSON
         logging.debug(f"Saving app settings to: {path}")
-        write_json(path, self.as_dict())
+        # The previous settings are kept, in case these are lost to a crash
+        write_json(path, self.as_dict(), backup=True)
@@ -0,0 +1,133 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Union
+
+from coronainfo.models import CoronaDataset, CoronaHeaders
+from coronainfo.models.model_dataset import FIELD_NAMES, NUMERIC_FIELDS
+from coronainfo.utils.search import fold
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    fetched TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS rows (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    country TEXT NOT NULL,
+    {", ".join(f"{name} INTEGER NOT NULL" for name in NUMERIC_FIELDS)},
+    PRIMARY KEY (snapshot_id, country)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rows_country ON rows (country, snapshot_id);
+{"".join(f"CREATE INDEX IF NOT EXISTS rows_{name} ON rows (snapshot_id, {name});" for name in NUMERIC_FIELDS)}
+"""
+INSERT_ROW = f"INSERT OR REPLACE INTO rows VALUES (?, {', '.join('?' for _ in FIELD_NAMES)})"
+
+
+class SqliteStore:
+    """
+    Stores every fetched dataset as a snapshot in an SQLite database, with indexes on the country and on every
+    numeric column, so searching, sorting and history queries can be answered by SQL instead of scanning rows in
+    Python. The database runs in WAL mode, so the UI can read while a worker thread is writing.
+    """
+    Error = sqlite3.Error
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        # Searches fold names the same way the in-memory search index does, LIKE only ignores ASCII case
+        self._connection.create_function("fold", 1, fold, deterministic=True)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def add_snapshot(self, fetched: str, dataset: CoronaDataset) -> int:
+        """
+        Stores a dataset as the snapshot fetched at the given time, replacing any snapshot with the same time.
+
+        Returns
+        -------
+        int
+            The id of the snapshot.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM snapshots WHERE fetched = ?", (fetched,))
+            snapshot_id = self._connection.execute(
+                "INSERT INTO snapshots (fetched) VALUES (?)", (fetched,)
+            ).lastrowid
+            self._connection.executemany(INSERT_ROW, ((snapshot_id, *row.as_tuple()) for row in dataset))
+
+        logging.debug(f"Stored {len(dataset)} rows as snapshot {snapshot_id} ({fetched})")
+        return snapshot_id
+
+    def latest_snapshot(self) -> Union[int, None]:
+        with self._lock:
+            row = self._connection.execute("SELECT id FROM snapshots ORDER BY fetched DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def get_snapshot(self, snapshot_id: int) -> CoronaDataset:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(FIELD_NAMES)} FROM rows WHERE snapshot_id = ? ORDER BY country",
+                (snapshot_id,)
+            ).fetchall()
+        return CoronaDataset.from_rows(rows)
+
+    def search(self, text: str, snapshot_id: int = None, order_by: Union[str, CoronaHeaders] = None,
+               descending: bool = False) -> list[str]:
+        """
+        Returns the countries of a snapshot (the latest by default) whose names contain the given text, ignoring case
+        and accents, optionally sorted by a column.
+        """
+        if snapshot_id is None:
+            snapshot_id = self.latest_snapshot()
+
+        order = f"{_column_name(order_by)} {'DESC' if descending else 'ASC'}" if order_by else "country"
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT country FROM rows WHERE snapshot_id = ? AND instr(fold(country), ?) > 0 ORDER BY {order}",
+                (snapshot_id, fold(text))
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def series(self, country: str, column: Union[str, CoronaHeaders]) -> list[tuple[str, int]]:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT snapshots.fetched, rows.{_column_name(column)} FROM rows "
+                "JOIN snapshots ON snapshots.id = rows.snapshot_id "
+                "WHERE rows.country = ? ORDER BY snapshots.fetched",
+                (country,)
+            ).fetchall()
+
+    def top(self, column: Union[str, CoronaHeaders], day: str, count: int = 10,
+            largest: bool = True) -> list[tuple[str, int]]:
+        """
+        Returns the countries with the largest (or smallest) values of a column in the last snapshot fetched on the
+        given day, formatted as YYYY-MM-DD.
+        """
+        name = _column_name(column)
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT country, {name} FROM rows WHERE snapshot_id = ("
+                "    SELECT id FROM snapshots WHERE date(fetched) = ? ORDER BY fetched DESC LIMIT 1"
+                f") ORDER BY {name} {'DESC' if largest else 'ASC'} LIMIT ?",
+                (day, count)
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def _column_name(column: Union[str, CoronaHeaders]) -> str:
+    # Column names cannot be bound as parameters, so only ever interpolate known field names
+    name = column.name.lower() if isinstance(column, CoronaHeaders) else column
+    if name not in FIELD_NAMES:
+        raise ValueError(f"Unknown column: {column}")
+    return name
@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Mapping, Sequence
+
+
+@dataclass
+class RowDiff:
+    """
+    The changes needed to turn one keyed set of rows into another.
+
+    `changed` maps the key of every row that exists on both sides but differs to the indices of its changed columns
+    and their new values. `added` holds whole rows that are new, in the order they were given, and `removed` holds
+    the keys of rows that no longer exist.
+    """
+    changed: dict[Hashable, tuple[tuple[int, ...], tuple]] = field(default_factory=dict)
+    added: list[Sequence] = field(default_factory=list)
+    removed: list[Hashable] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.changed or self.added or self.removed)
+
+
+class RowDiffer:
+    """
+    Diffs a new set of rows against the current rows incrementally, so rows can be compared and applied batch by
+    batch as they arrive. Removed rows are only known once every new row has been fed.
+    """
+
+    def __init__(self, current: Mapping[Hashable, Sequence], key_column: int = 0):
+        self.current = current
+        self.key_column = key_column
+        self._seen = set()
+
+    def feed(self, rows: Iterable[Sequence]) -> RowDiff:
+        diff = RowDiff()
+        for row in rows:
+            key = row[self.key_column]
+            self._seen.add(key)
+
+            old_row = self.current.get(key)
+            if old_row is None:
+                diff.added.append(row)
+                continue
+
+            columns = tuple(i for i, (old, new) in enumerate(zip(old_row, row)) if old != new)
+            if columns:
+                diff.changed[key] = (columns, tuple(row[i] for i in columns))
+
+        return diff
+
+    def finish(self) -> list[Hashable]:
+        return [key for key in self.current if key not in self._seen]
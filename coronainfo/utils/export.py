@@ -0,0 +1,245 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from array import array
+from typing import BinaryIO, Iterator, Sequence, TextIO, Union
+
+from coronainfo.enums import Date
+from coronainfo.models import CoronaDataset
+from coronainfo.models.model_dataset import FIELD_NAMES
+from coronainfo.utils.history import SnapshotStore
+from coronainfo.utils.snapshot import dump_snapshot
+
+FETCHED_FIELD = "fetched"  # Leading column of history exports
+
+
+class ExportTable:
+    """
+    The rows and columns of data to export. Nothing is copied up front: rows are read straight out of the columns as
+    they are written, and a selection of rows is only a sequence of indexes into them.
+    """
+
+    def __init__(self, names: Sequence[str], columns: Sequence[Sequence], indexes: Sequence[int] = None):
+        if len(names) != len(columns):
+            raise ValueError(f"Expected {len(names)} columns, got {len(columns)}")
+
+        self.names = tuple(names)
+        self.columns = columns
+        self.indexes = indexes
+
+    @classmethod
+    def from_dataset(cls, dataset: CoronaDataset, fields: Sequence[int] = None, indexes: Sequence[int] = None):
+        """
+        Selects the given fields, by index, and rows of a dataset. Every field and row is selected by default.
+        """
+        fields = range(len(FIELD_NAMES)) if fields is None else fields
+        return cls([FIELD_NAMES[field] for field in fields], [dataset.column(field) for field in fields], indexes)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence], fields: Sequence[int] = None):
+        """
+        Selects the given fields, by index, of rows that start with the value of every field, such as the rows of the
+        main window's model.
+        """
+        fields = range(len(FIELD_NAMES)) if fields is None else fields
+        return cls([FIELD_NAMES[field] for field in fields], [RowColumn(rows, field) for field in fields])
+
+    def to_dataset(self) -> CoronaDataset:
+        """
+        Returns the selected rows as a dataset, which only shares the columns if every row is selected.
+
+        Raises
+        ------
+        ValueError
+            If any field is missing, as a dataset always holds every field.
+        """
+        if self.names != FIELD_NAMES:
+            raise ValueError("Every field must be selected to export a dataset")
+
+        countries, *columns = self.columns
+        if self.indexes is None:
+            return CoronaDataset(countries, [
+                column if isinstance(column, array) else array("q", column) for column in columns
+            ])
+
+        return CoronaDataset(
+            [countries[index] for index in self.indexes],
+            [array("q", map(column.__getitem__, self.indexes)) for column in columns]
+        )
+
+    def __iter__(self) -> Iterator[tuple]:
+        if self.indexes is None:
+            return zip(*self.columns)
+        return zip(*(map(column.__getitem__, self.indexes) for column in self.columns))
+
+    def __len__(self):
+        if self.indexes is not None:
+            return len(self.indexes)
+        return len(self.columns[0]) if self.columns else 0
+
+
+class RowColumn(Sequence):
+    """
+    A read-only view of a single column of a sequence of rows.
+    """
+
+    def __init__(self, rows: Sequence[Sequence], column: int):
+        self._rows = rows
+        self._column = column
+
+    def __getitem__(self, index: int):
+        return self._rows[index][self._column]
+
+    def __iter__(self):
+        column = self._column
+        return (row[column] for row in self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+
+class TableWriter(ABC):
+    """
+    Streams tables to a file in one export format. Several tables with the same columns can be written one after the
+    other, they end up as a single table.
+    """
+    name = ""
+    label = ""
+    extension = ""
+    binary = False  # Whether the file should be opened in binary mode
+    all_fields = False  # Whether every field must be exported
+
+    def __init__(self, file: Union[TextIO, BinaryIO], names: Sequence[str]):
+        self.file = file
+        self.names = tuple(names)
+
+    @abstractmethod
+    def write(self, table: ExportTable):
+        pass
+
+    def close(self):
+        pass
+
+
+class CsvWriter(TableWriter):
+    name = "csv"
+    label = "CSV"
+    extension = ".csv"
+
+    def __init__(self, file: TextIO, names: Sequence[str]):
+        super().__init__(file, names)
+        self._writer = csv.writer(file)
+        self._writer.writerow(self.names)
+
+    def write(self, table: ExportTable):
+        self._writer.writerows(table)
+
+
+class NdjsonWriter(TableWriter):
+    """
+    Writes one JSON object per line. Objects are put together from their encoded keys and values, so no dict is built
+    for any row.
+    """
+    name = "ndjson"
+    label = "Newline-delimited JSON"
+    extension = ".ndjson"
+    separator = "\n"
+
+    def __init__(self, file: TextIO, names: Sequence[str]):
+        super().__init__(file, names)
+        self._keys = [json.dumps(name) + ":" for name in self.names]
+        self._count = 0
+
+    def write(self, table: ExportTable):
+        keys = self._keys
+        for row in table:
+            if self._count:
+                self.file.write(self.separator)
+            self.file.write("{" + ",".join([key + json.dumps(value) for key, value in zip(keys, row)]) + "}")
+            self._count += 1
+
+    def close(self):
+        if self._count:
+            self.file.write("\n")
+
+
+class JsonWriter(NdjsonWriter):
+    """
+    Writes a single JSON array of objects, the format of the JSON cache.
+    """
+    name = "json"
+    label = "JSON"
+    extension = ".json"
+    separator = ",\n"
+
+    def __init__(self, file: TextIO, names: Sequence[str]):
+        super().__init__(file, names)
+        self.file.write("[")
+
+    def close(self):
+        self.file.write("]\n")
+
+
+class SnapshotWriter(TableWriter):
+    """
+    Writes every table as its own binary snapshot, the columnar format of the binary cache, which can be read back
+    with `read_snapshot`, or `read_snapshots` for a file of several of them.
+    """
+    name = "binary"
+    label = "Columnar binary"
+    extension = ".cids"
+    binary = True
+    all_fields = True
+
+    def write(self, table: ExportTable):
+        dump_snapshot(table.to_dataset(), self.file)
+
+
+EXPORT_FORMATS: dict[str, type[TableWriter]] = {
+    writer.name: writer for writer in (CsvWriter, NdjsonWriter, JsonWriter, SnapshotWriter)
+}
+
+
+def export_table(table: ExportTable, file: Union[TextIO, BinaryIO], export_format: str):
+    """
+    Streams a table to a file object, which must be opened in the mode of the format. Text files should be opened
+    with `newline=""`, which the CSV format needs.
+    """
+    writer = EXPORT_FORMATS[export_format](file, table.names)
+    writer.write(table)
+    writer.close()
+
+
+def export_history(store: SnapshotStore, file: Union[TextIO, BinaryIO], export_format: str,
+                   fields: Sequence[int] = None):
+    """
+    Streams every snapshot in the history to a file object, oldest first. Text formats get a leading column of when
+    each row was fetched, while the binary format holds the snapshots as they are, one after the other.
+
+    Snapshots are read from the memory-mapped log one at a time, so the log is never held in memory as a whole.
+    """
+    writer_type = EXPORT_FORMATS[export_format]
+    entries = sorted(store.entries(), key=lambda entry: entry.fetched)
+    if writer_type.all_fields:
+        for entry in entries:
+            file.write(store.raw(entry))
+        return
+
+    fields = range(len(FIELD_NAMES)) if fields is None else fields
+    writer = writer_type(file, (FETCHED_FIELD, *(FIELD_NAMES[field] for field in fields)))
+    for entry in entries:
+        table = ExportTable.from_dataset(store.get(entry), fields)
+        fetched = entry.fetched.strftime(Date.RAW_FORMAT)
+        # Every row of the snapshot refers to the same string
+        writer.write(ExportTable(writer.names, [[fetched] * len(table), *table.columns]))
+    writer.close()
+
+
+def format_for_path(path: str, default: str = CsvWriter.name) -> str:
+    """
+    Returns the name of the export format whose extension the given path has, or the default if there is none.
+    """
+    for writer in EXPORT_FORMATS.values():
+        if path.lower().endswith(writer.extension):
+            return writer.name
+    return default
@@ -0,0 +1,194 @@
+import codecs
+import importlib
+import importlib.util
+import logging
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterator, Protocol, Union
+
+from coronainfo.enums import App, Paths
+from coronainfo.models.model_base import BaseData
+from coronainfo.utils.files import get_json, write_json
+
+if TYPE_CHECKING:
+    from http.client import HTTPResponse
+
+WORLDOMETERS_URL = "https://www.worldometers.info/coronavirus/"
+USER_AGENT = f"{App.NAME.replace(' ', '')}/{App.VERSION} (+{App.WEBSITE})"
+CHUNK_SIZE = 16 * 1024
+FETCH_TIMEOUT = 15  # Seconds a connection may stall for before giving up
+# urllib and the brotli bindings are only imported once something is actually fetched, so reading the cache at startup
+# does not pay for them
+BROTLI_MODULE = next((name for name in ("brotli", "brotlicffi") if importlib.util.find_spec(name)), None)
+
+
+class FetchCancelled(Exception):
+    pass
+
+
+class Cancellable(Protocol):
+    """
+    Anything that can tell whether an operation has been cancelled, such as `Gio.Cancellable`.
+    """
+
+    def is_cancelled(self) -> bool:
+        ...
+
+
+@dataclass
+class CacheValidators(BaseData):
+    """
+    The HTTP validators of the page that the cache was parsed from, stored alongside the cache.
+    """
+    etag: str = ""
+    last_modified: str = ""
+
+    @classmethod
+    def fetch_validators(cls):
+        if not Paths.CACHE_JSON.exists():
+            # Validators are worthless without the cache they describe
+            return cls()
+
+        try:
+            return cls(**get_json(Paths.CACHE_META_JSON))
+        except Exception as err:
+            logging.debug(f"No usable cache validators: {err}")
+            return cls()
+
+    def commit(self):
+        path = Paths.CACHE_META_JSON
+        logging.debug(f"Saving cache validators to: {path}")
+        write_json(path, self.as_dict())
+
+
+@dataclass
+class FetchResponse:
+    """
+    A fetched page. `chunks` lazily yields the decoded text of the body while it is still being downloaded, and is
+    `None` if the page has not been modified. The underlying connection is closed once `chunks` is exhausted or
+    the response is closed.
+    """
+    chunks: Union[Iterator[str], None]
+    validators: CacheValidators
+
+    @property
+    def not_modified(self) -> bool:
+        return self.chunks is None
+
+    def close(self):
+        if self.chunks is not None:
+            self.chunks.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def fetch_page(url: str = WORLDOMETERS_URL, validators: CacheValidators = None,
+               timeout: float = FETCH_TIMEOUT, cancellable: Cancellable = None) -> FetchResponse:
+    """
+    Fetches the page at the given URL, negotiating a compressed transfer. If validators are given, the request is
+    made conditional, and a 304 response short-circuits into a `FetchResponse` without content.
+
+    The timeout applies to every blocking socket operation, so a stalled connection fails instead of hanging. The
+    cancellable is checked between chunks while the body is being read.
+
+    Raises
+    ------
+    FetchCancelled
+        If the cancellable was cancelled while the body was being read.
+    OSError
+        If the request fails or times out for any reason other than the page not being modified.
+    """
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(url, headers={
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": ", ".join(DECOMPRESSORS)
+    })
+    if validators is not None:
+        if validators.etag:
+            request.add_header("If-None-Match", validators.etag)
+        if validators.last_modified:
+            request.add_header("If-Modified-Since", validators.last_modified)
+
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as err:
+        if err.code == 304:
+            logging.info(f"{url} has not been modified since the last fetch")
+            return FetchResponse(None, validators)
+        raise
+
+    new_validators = CacheValidators(
+        response.headers.get("ETag", ""),
+        response.headers.get("Last-Modified", "")
+    )
+    return FetchResponse(stream_text(response, cancellable=cancellable), new_validators)
+
+
+def stream_text(response: "HTTPResponse", chunk_size: int = CHUNK_SIZE,
+                cancellable: Cancellable = None) -> Iterator[str]:
+    """
+    Reads the body of the given response chunk by chunk, decompressing and decoding each chunk as it arrives.
+    """
+    encoding = response.headers.get("Content-Encoding", "identity").strip().lower()
+    charset = response.headers.get_content_charset() or "utf-8"
+    logging.debug(f"Streaming response body (encoding: {encoding}, charset: {charset})")
+
+    decompressor = DECOMPRESSORS.get(encoding, _Identity)()
+    decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    try:
+        while chunk := response.read(chunk_size):
+            if cancellable is not None and cancellable.is_cancelled():
+                raise FetchCancelled()
+
+            text = decoder.decode(decompressor.process(chunk))
+            if text:
+                yield text
+
+        yield decoder.decode(decompressor.flush(), final=True)
+
+    finally:
+        response.close()
+
+
+class _Identity:
+    def process(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Zlib:
+    def __init__(self, wbits: int):
+        self._decompressor = zlib.decompressobj(wbits)
+
+    def process(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._decompressor = importlib.import_module(BROTLI_MODULE).Decompressor()
+
+    def process(self, data: bytes) -> bytes:
+        return self._decompressor.process(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+DECOMPRESSORS: dict[str, Callable] = {
+    "gzip": lambda: _Zlib(16 + zlib.MAX_WBITS),
+    "deflate": lambda: _Zlib(zlib.MAX_WBITS),
+}
+if BROTLI_MODULE:
+    DECOMPRESSORS["br"] = _Brotli
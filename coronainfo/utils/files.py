@@ -1,21 +1,109 @@
 import json
+import logging
+import os
+import shutil
+import threading
+import zlib
 from typing import Union
 from pathlib import Path
 
+CHECKSUM_PREFIX = "#crc32:"  # First line of JSON files written by `write_json`
+BACKUP_SUFFIX = ".bak"
+
+
+class ChecksumError(ValueError):
+    pass
+
 
 def write_file(file_path: Union[str, Path], content: str):
     with open(file_path, "w") as file:
         file.write(content)
 
 
-def write_json(file_path: Union[str, Path], json_data):
-    with open(file_path, "w") as file:
-        json.dump(json_data, file)
+def write_atomic(file_path: Union[str, Path], data: bytes, backup: bool = False):
+    """
+    Writes data to a file so that the file always holds either its old or its new contents in full, even if the
+    application crashes or another instance writes the same file at the same time. The data is written and synced to
+    a temporary file next to the destination, which is then renamed over it.
+
+    Parameters
+    ----------
+    file_path: str | Path
+        The path of the file to write.
+    data: bytes
+        The new contents of the file.
+    backup: bool
+        Whether to keep the previous contents of the file next to it, with `BACKUP_SUFFIX` appended to its name.
+    """
+    file_path = Path(file_path)
+    temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        if backup:
+            _keep_backup(file_path, temp_path)
+        # The only step that changes the destination
+        os.replace(temp_path, file_path)
+
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    _sync_directory(file_path.parent)
+
+
+def backup_path(file_path: Union[str, Path]) -> Path:
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + BACKUP_SUFFIX)
+
+
+def write_json(file_path: Union[str, Path], json_data, backup: bool = False):
+    """
+    Atomically writes JSON data to a file, preceded by a header line with the checksum of the data.
+    """
+    content = json.dumps(json_data).encode("utf-8")
+    header = f"{CHECKSUM_PREFIX}{zlib.crc32(content):08x}\n".encode("utf-8")
+    write_atomic(file_path, header + content, backup)
 
 
 def get_json(file_path: Union[str, Path]):
-    with open(file_path, "r") as file:
-        return json.load(file)
+    """
+    Reads a JSON file, verifying its checksum if it has one.
+
+    Raises
+    ------
+    ChecksumError
+        If the contents of the file do not match its checksum.
+    """
+    with open(file_path, "rb") as file:
+        content = file.read()
+
+    if content.startswith(CHECKSUM_PREFIX.encode("utf-8")):
+        header, _, content = content.partition(b"\n")
+        expected = header[len(CHECKSUM_PREFIX):].decode("utf-8")
+        actual = f"{zlib.crc32(content):08x}"
+        if actual != expected:
+            raise ChecksumError(f"{file_path} is corrupted, its checksum is {actual} instead of {expected}")
+
+    return json.loads(content)
+
+
+def get_json_or_backup(file_path: Union[str, Path]):
+    """
+    Reads a JSON file, falling back to its backup if the file is missing or corrupted.
+    """
+    try:
+        return get_json(file_path)
+    except (OSError, ValueError) as err:
+        backup = backup_path(file_path)
+        if not backup.exists():
+            raise
+
+        logging.warning(f"Unable to read {file_path}, falling back to {backup}: {err}")
+        return get_json(backup)
 
 
 def get_file_content(file_path: str) -> str:
@@ -34,3 +122,40 @@ def get_file_content(file_path: str) -> str:
     """
     with open(file_path, "r") as file:
         return file.read()
+
+
+def _keep_backup(file_path: Path, temp_path: Path):
+    # The previous contents were written atomically too, so they are known to be complete. They are linked, or copied
+    # where links are not supported, to a new name, so the destination never goes missing while the backup is made.
+    backup_temp = temp_path.with_name(temp_path.name + BACKUP_SUFFIX)
+    try:
+        try:
+            os.link(file_path, backup_temp)
+        except FileNotFoundError:
+            return
+        except OSError:
+            shutil.copyfile(file_path, backup_temp)
+
+        os.replace(backup_temp, backup_path(file_path))
+
+    except FileNotFoundError:
+        # Nothing to back up yet
+        pass
+
+    finally:
+        backup_temp.unlink(missing_ok=True)
+
+
+def _sync_directory(directory: Path):
+    # Makes the rename itself durable. Not every platform can open a directory, which only costs durability.
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,59 @@
+from typing import Callable, Sequence, Union
+
+from coronainfo.models import CoronaHeaders
+
+ORANGE = "rgb(255, 145, 0)"
+RED = "rgb(220, 0, 0)"
+GREEN = "rgb(0, 160, 0)"
+BLUE = "rgb(82, 119, 145)"
+
+# Foreground colours of the columns that have them, as (colour when >= 0, colour when < 0)
+COLOURS: dict[CoronaHeaders, tuple[str, str]] = {
+    CoronaHeaders.NEW_CASES: (ORANGE, BLUE),
+    CoronaHeaders.NEW_DEATHS: (RED, BLUE),
+    CoronaHeaders.NEW_RECOVERED: (GREEN, RED),
+}
+
+
+def _format_text(value) -> str:
+    return str(value)
+
+
+def _format_number(value: int) -> str:
+    return f"{value:,}"
+
+
+def _format_change(value: int) -> str:
+    return f"{value:+,}"
+
+
+def _column_formatter(header: CoronaHeaders) -> Callable:
+    if header is CoronaHeaders.COUNTRY:
+        return _format_text
+    if "NEW" in header.name:
+        return _format_change
+    return _format_number
+
+
+def _column_colour(header: CoronaHeaders) -> Callable:
+    colours = COLOURS.get(header)
+    if colours is None:
+        return lambda value: None
+
+    positive, negative = colours
+    return lambda value: positive if value >= 0 else negative
+
+
+# Worked out once per column, so formatting a cell is a single call
+FORMATTERS: tuple[Callable, ...] = tuple(_column_formatter(header) for header in CoronaHeaders)
+COLOURERS: tuple[Callable, ...] = tuple(_column_colour(header) for header in CoronaHeaders)
+
+
+def render_row(row: Sequence) -> tuple[Union[str, None], ...]:
+    """
+    Renders a row for display: the formatted text of every column, followed by the foreground colour of every
+    column, which is None for columns without one.
+    """
+    texts = tuple(formatter(value) for formatter, value in zip(FORMATTERS, row))
+    colours = tuple(colourer(value) for colourer, value in zip(COLOURERS, row))
+    return texts + colours
@@ -1,6 +1,18 @@
+import importlib.util
 import re
 import types
 import typing
+from array import array
+from typing import Iterable, Sequence
+
+# NumPy takes longer to import than the rest of the application's modules combined, so it is only imported once a
+# column is large enough to need it
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+FLOAT_PATTERN = re.compile(r"^\d*\.\d*$")
+DECIMAL_PATTERN = re.compile(r"^[+-]?\d*\.\d*$")
+MISSING_VALUES = ("", "N/A")
+NUMPY_THRESHOLD = 1000  # Below this many values, NumPy's setup cost outweighs its speed
 
 
 def is_float(text: str) -> bool:
@@ -17,7 +29,7 @@ def is_float(text: str) -> bool:
     bool
         A boolean of whether the given string is a float number or not.
     """
-    match = re.match(r"^\d*\.\d*$", text.strip())
+    match = FLOAT_PATTERN.match(text.strip())
 
     return bool(match)
 
@@ -82,3 +94,67 @@ def spread_subtypes(subtypes: tuple, accumulator: tuple = ()) -> tuple:
 
     result = set(accumulator)  # Remove duplications
     return tuple(result)
+
+
+def convert_column(values: Sequence[str]) -> array:
+    """
+    Converts a whole column of raw table cells into ints in one pass. Thousands separators and surrounding whitespace
+    are ignored, missing values ("" or "N/A") become 0, signs are kept and decimals are truncated. Large columns are
+    converted with NumPy if it is installed.
+
+    Parameters
+    ----------
+    values: Sequence[str]
+        The raw text of every cell in the column.
+
+    Returns
+    -------
+    array
+        An array('q') of the converted values, in the same order.
+
+    Raises
+    ------
+    ValueError
+        If a cell is not a number.
+    """
+    if NUMPY_AVAILABLE and len(values) >= NUMPY_THRESHOLD:
+        return _convert_column_numpy(values)
+
+    result = array("q")
+    append = result.append
+    for value in values:
+        text = value.replace(",", "").strip()
+        # Plain digits are by far the most common, so they skip every other check
+        if text.isdigit():
+            append(int(text))
+        else:
+            append(_convert_cell(text))
+
+    return result
+
+
+def _convert_cell(text: str) -> int:
+    if text in MISSING_VALUES:
+        return 0
+    if text[0] in "+-" and text[1:].isdigit():
+        return int(text)
+    if DECIMAL_PATTERN.match(text):
+        return int(float(text))
+
+    raise ValueError(f"'{text}' is not a number")
+
+
+def _convert_column_numpy(values: Iterable[str]) -> array:
+    import numpy
+
+    cells = numpy.char.strip(numpy.char.replace(numpy.asarray(values, dtype=str), ",", ""))
+    cells[numpy.isin(cells, MISSING_VALUES)] = "0"
+
+    decimal = numpy.char.find(cells, ".") != -1
+    converted = numpy.empty(len(cells), dtype=numpy.int64)
+    converted[~decimal] = cells[~decimal].astype(numpy.int64)
+    converted[decimal] = cells[decimal].astype(numpy.float64).astype(numpy.int64)
+
+    result = array("q")
+    result.frombytes(converted.tobytes())
+    return result
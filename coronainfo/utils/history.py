@@ -0,0 +1,166 @@
+import heapq
+import logging
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Union
+
+from coronainfo.enums import Date
+from coronainfo.models import CoronaDataset, CoronaHeaders
+from coronainfo.utils.snapshot import dump_snapshot, read_snapshot
+
+# Every index entry points at one snapshot in the log: when it was fetched, and where it starts and how long it is
+INDEX_ENTRY = struct.Struct("<qQQ")
+LOG_NAME = "snapshots.log"
+INDEX_NAME = "snapshots.idx"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    fetched: datetime
+    offset: int
+    size: int
+
+
+class SnapshotStore:
+    """
+    An append-only history of fetched datasets. Snapshots are appended to a single log file in the binary snapshot
+    format, and a separate fixed-width index records where each one starts. The log is memory-mapped, so queries only
+    read the columns they need from the snapshots they need.
+
+    The index is only written after its snapshot has been fully written, so an interrupted append leaves at most some
+    unreferenced bytes at the end of the log, and a partial entry at the end of the index that the next append drops.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.log_path = self.directory / LOG_NAME
+        self.index_path = self.directory / INDEX_NAME
+
+        self._entries: Union[list[IndexEntry], None] = None
+        self._log: Union[mmap.mmap, None] = None
+        self._country_indexes: dict[int, dict[str, int]] = {}
+
+    def append(self, fetched: Union[str, datetime], dataset: CoronaDataset) -> IndexEntry:
+        """
+        Appends a dataset to the history, keyed by when it was fetched, either as a datetime or in `Date.RAW_FORMAT`.
+        """
+        if isinstance(fetched, str):
+            fetched = datetime.strptime(fetched, Date.RAW_FORMAT)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as log:
+            offset = log.seek(0, os.SEEK_END)
+            size = dump_snapshot(dataset, log)
+            log.flush()
+            os.fsync(log.fileno())
+
+        with open(self.index_path, "ab") as index:
+            # Drop a partially written entry left by an interrupted append, it would misalign every entry after it
+            length = index.seek(0, os.SEEK_END)
+            if length % INDEX_ENTRY.size:
+                index.truncate(length - length % INDEX_ENTRY.size)
+            index.write(INDEX_ENTRY.pack(int(fetched.timestamp()), offset, size))
+            index.flush()
+            os.fsync(index.fileno())
+
+        entry = IndexEntry(fetched, offset, size)
+        logging.debug(f"Appended snapshot to history: {entry}")
+        self._entries = None
+        self._log = None
+        return entry
+
+    def entries(self) -> list[IndexEntry]:
+        if self._entries is None:
+            self._entries = self._read_index()
+        return self._entries
+
+    def get(self, entry: IndexEntry, verify: bool = False) -> CoronaDataset:
+        """
+        Returns the dataset of the given entry, backed by the memory-mapped log. Its checksum is only verified if
+        asked to, as queries read the same snapshots many times.
+        """
+        return read_snapshot(self._get_log(), entry.offset, verify)
+
+    def raw(self, entry: IndexEntry) -> memoryview:
+        """
+        Returns the bytes of the given entry's snapshot, as a view of the memory-mapped log.
+        """
+        return memoryview(self._get_log())[entry.offset:entry.offset + entry.size]
+
+    def latest(self, verify: bool = False) -> Union[CoronaDataset, None]:
+        """
+        Returns the most recently fetched dataset. Tables of previous days are appended after the table they were
+        fetched with, so this is not necessarily the last snapshot in the log.
+        """
+        entries = self.entries()
+        return self.get(max(entries, key=lambda entry: entry.fetched), verify) if entries else None
+
+    def on_date(self, day: date) -> Union[IndexEntry, None]:
+        """
+        Returns the last snapshot that was fetched on the given day.
+        """
+        start = datetime.combine(day, time.min)
+        end = datetime.combine(day, time.max)
+        matches = [entry for entry in self.entries() if start <= entry.fetched <= end]
+        return max(matches, key=lambda entry: entry.fetched) if matches else None
+
+    def series(self, country: str, column: Union[str, CoronaHeaders]) -> list[tuple[datetime, int]]:
+        """
+        Returns the value of a column for a country in every snapshot that has that country, oldest first.
+        """
+        result = []
+        # Tables of previous days are appended after the table they were fetched with, so log order is not time order
+        for entry in sorted(self.entries(), key=lambda entry: entry.fetched):
+            row = self._country_index(entry.offset).get(country)
+            if row is not None:
+                result.append((entry.fetched, self.get(entry).column(column)[row]))
+
+        return result
+
+    def top(self, column: Union[str, CoronaHeaders], day: date, count: int = 10,
+            largest: bool = True) -> list[tuple[str, int]]:
+        """
+        Returns the countries with the largest (or smallest) values of a column in the last snapshot of the given day.
+        """
+        entry = self.on_date(day)
+        if entry is None:
+            return []
+
+        dataset = self.get(entry)
+        values = dataset.column(column)
+        select = heapq.nlargest if largest else heapq.nsmallest
+        rows = select(count, range(len(values)), key=values.__getitem__)
+        return [(dataset.countries[row], values[row]) for row in rows]
+
+    def _country_index(self, offset: int) -> dict[str, int]:
+        # Snapshots never change once written, so their country lookups can be kept for as long as the store lives
+        index = self._country_indexes.get(offset)
+        if index is None:
+            countries = read_snapshot(self._get_log(), offset, verify=False).countries
+            index = {country: row for row, country in enumerate(countries)}
+            self._country_indexes[offset] = index
+
+        return index
+
+    def _get_log(self) -> mmap.mmap:
+        if self._log is None:
+            with open(self.log_path, "rb") as log:
+                self._log = mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._log
+
+    def _read_index(self) -> list[IndexEntry]:
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        # Ignore a partially written entry at the end
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        return [
+            IndexEntry(datetime.fromtimestamp(timestamp), offset, size)
+            for timestamp, offset, size in INDEX_ENTRY.iter_unpack(data[:usable])
+        ]
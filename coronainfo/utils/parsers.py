@@ -0,0 +1,365 @@
+import importlib.util
+import logging
+import sys
+from collections import deque
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Callable, Iterable, Iterator, Sequence, Union
+
+from coronainfo.models import CoronaData, CoronaDataset
+from coronainfo.utils.functions import convert_column
+
+TODAY_TABLE_ID = "main_table_countries_today"
+YESTERDAY_TABLE_ID = "main_table_countries_yesterday"
+YESTERDAY2_TABLE_ID = "main_table_countries_yesterday2"
+DAY_TABLE_IDS = (TODAY_TABLE_ID, YESTERDAY_TABLE_ID, YESTERDAY2_TABLE_ID)  # Indexed by how many days ago they are
+SKIPPED_ROWS = 7  # Continent and world rows at the top of the table body
+CELL_SLICE = slice(1, 15)  # Skip the row number column and anything after the population column
+CHUNK_SIZE = 64 * 1024
+DEFAULT_BACKEND = "streaming"
+
+
+class ParseError(ValueError):
+    pass
+
+
+class TableParser(HTMLParser):
+    """
+    An event-based parser that only keeps track of the rows of the tables with the given ids. Everything outside
+    those tables is skipped without building any tree, and parsing stops once the first body of every table has been
+    read. Completed rows can be drained with `pop_rows` or `pop_table_rows` while the document is still being fed.
+    """
+
+    def __init__(self, table_ids: Union[str, Iterable[str]], skip_rows: int = SKIPPED_ROWS):
+        super().__init__()
+        self.table_ids = (table_ids,) if isinstance(table_ids, str) else tuple(table_ids)
+        self.skip_rows = skip_rows
+        self.done = not self.table_ids
+        self.found: set[str] = set()
+
+        self._rows: deque[tuple[str, list[str]]] = deque()
+        self._remaining = set(self.table_ids)
+        self._table: Union[str, None] = None
+        self._table_depth = 0
+        self._in_body = False
+        self._row_count = 0
+        self._row: Union[list[str], None] = None
+        self._cell: Union[list[str], None] = None
+
+    def feed(self, data: str):
+        if not self.done:
+            super().feed(data)
+
+    def pop_rows(self) -> Iterator[list[str]]:
+        for _, row in self.pop_table_rows():
+            yield row
+
+    def pop_table_rows(self) -> Iterator[tuple[str, list[str]]]:
+        while self._rows:
+            yield self._rows.popleft()
+
+    def handle_starttag(self, tag: str, attrs: list):
+        if self.done:
+            return
+
+        if not self._table_depth:
+            if tag == "table":
+                table_id = dict(attrs).get("id")
+                if table_id in self._remaining:
+                    self.found.add(table_id)
+                    self._table = table_id
+                    self._table_depth = 1
+                    self._row_count = 0
+            return
+
+        if tag == "table":
+            self._table_depth += 1
+        elif self._table is None:
+            # The rest of a table whose rows have already been read
+            return
+        elif tag == "tbody":
+            self._in_body = True
+        elif tag == "tr" and self._in_body:
+            self._end_row()
+            self._row = []
+        elif tag == "td" and self._row is not None:
+            self._end_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag: str):
+        if self.done or not self._table_depth:
+            return
+
+        if tag == "table":
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._end_table()
+        elif self._table is None:
+            return
+        elif tag == "td":
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "tbody" and self._in_body:
+            # Only the first body of the table holds the country rows
+            self._end_table()
+
+    def handle_data(self, data: str):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._row.append("".join(self._cell))
+            self._cell = None
+
+    def _end_row(self):
+        if self._row is None:
+            return
+
+        self._end_cell()
+        self._row_count += 1
+        if self._row_count > self.skip_rows:
+            self._rows.append((self._table, self._row))
+        self._row = None
+
+    def _end_table(self):
+        if self._table is None:
+            return
+
+        self._end_row()
+        self._remaining.discard(self._table)
+        self._table = None
+        self._in_body = False
+        self.done = not self._remaining
+
+
+@dataclass(frozen=True)
+class ParserBackend:
+    name: str
+    requires: tuple[str, ...]
+    extract_rows: Callable[[Union[str, Iterable[str]], str], Iterator[list[str]]]
+    # Extracts several tables in a single pass, as (table id, row) pairs
+    extract_all: Callable[[Union[str, Iterable[str]], Sequence[str]], Iterator[tuple[str, list[str]]]] = None
+
+    def is_available(self) -> bool:
+        return all(importlib.util.find_spec(module) for module in self.requires)
+
+    def extract_tables(self, source: Union[str, Iterable[str]],
+                       table_ids: Sequence[str]) -> Iterator[tuple[str, list[str]]]:
+        if self.extract_all is not None:
+            return self.extract_all(source, table_ids)
+
+        # Backends that build a tree need the whole document anyway, so it is only joined once for every table
+        html = join_source(source)
+        return (
+            (table_id, row)
+            for table_id in table_ids if f'id="{table_id}"' in html
+            for row in self.extract_rows(html, table_id)
+        )
+
+
+def parse_table(source: Union[str, Iterable[str]], table_id: str = TODAY_TABLE_ID,
+                backend: str = DEFAULT_BACKEND) -> Iterator[CoronaData]:
+    """
+    Lazily parses the rows of a worldometers table into `CoronaData`.
+
+    Parameters
+    ----------
+    source: str | Iterable[str]
+        Either the whole HTML document, or an iterable of HTML chunks in document order.
+    table_id: str
+        The id of the table to extract rows from.
+    backend: str
+        The name of the preferred parser backend. Falls back to the next available backend if it is not installed.
+
+    Returns
+    -------
+    Iterator[CoronaData]
+        An iterator that yields each row as soon as the backend has read it.
+    """
+    parser_backend = get_backend(backend)
+    return map(sanitise_row, parser_backend.extract_rows(source, table_id))
+
+
+def parse_datasets(source: Union[str, Iterable[str]], table_ids: Sequence[str] = DAY_TABLE_IDS,
+                   backend: str = DEFAULT_BACKEND,
+                   required: Sequence[str] = (TODAY_TABLE_ID,)) -> dict[str, CoronaDataset]:
+    """
+    Parses several worldometers tables of the same document into a `CoronaDataset` each, keyed by table id. The
+    streaming backend reads every table in a single pass over the document, while it is still being downloaded.
+    Tables that could not be found are empty, unless they are required.
+
+    Raises
+    ------
+    ParseError
+        If a required table that was asked for could not be found or has no rows.
+    """
+    parser_backend = get_backend(backend)
+    rows: dict[str, list] = {table_id: [] for table_id in table_ids}
+    for table_id, row in parser_backend.extract_tables(source, table_ids):
+        rows[table_id].append(row[CELL_SLICE])
+
+    missing = [table_id for table_id in required if table_id in rows and not rows[table_id]]
+    if missing:
+        raise ParseError(f"Table {', '.join(missing)} could not be found or has no rows")
+
+    return {table_id: build_dataset(table_rows) for table_id, table_rows in rows.items()}
+
+
+def build_dataset(rows: Sequence[Sequence[str]]) -> CoronaDataset:
+    """
+    Converts the raw cells of a table's rows into a `CoronaDataset`, converting every numeric column in a single batch.
+    """
+    if not rows:
+        return CoronaDataset()
+
+    countries, *numeric_columns = zip(*rows)
+    return CoronaDataset(
+        [sys.intern(sanitise_country(country)) for country in countries],
+        [convert_column(column) for column in numeric_columns]
+    )
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> ParserBackend:
+    """
+    Returns the parser backend with the given name if it is available, otherwise the first available backend in
+    order of preference. The streaming backend only needs the standard library, so there is always a fallback.
+    """
+    preferred = PARSER_BACKENDS.get(name)
+    if preferred and preferred.is_available():
+        return preferred
+
+    fallback = next(backend for backend in PARSER_BACKENDS.values() if backend.is_available())
+    logging.warning(f"Parser backend `{name}` is not available, falling back to `{fallback.name}`")
+    return fallback
+
+
+def available_backends() -> list[ParserBackend]:
+    return [backend for backend in PARSER_BACKENDS.values() if backend.is_available()]
+
+
+def _extract_streaming(source: Union[str, Iterable[str]], table_id: str) -> Iterator[list[str]]:
+    if isinstance(source, str):
+        source = iter_chunks(seek_table(source, table_id))
+
+    parser = TableParser(table_id)
+    for chunk in source:
+        parser.feed(chunk)
+        yield from parser.pop_rows()
+
+        if parser.done:
+            break
+
+    parser.close()
+    yield from parser.pop_rows()
+
+    if table_id not in parser.found:
+        raise ParseError(f"Table {table_id} could not be found")
+
+
+def _extract_streaming_tables(source: Union[str, Iterable[str]],
+                              table_ids: Sequence[str]) -> Iterator[tuple[str, list[str]]]:
+    if isinstance(source, str):
+        source = iter_chunks(source)
+
+    parser = TableParser(table_ids)
+    for chunk in source:
+        parser.feed(chunk)
+        yield from parser.pop_table_rows()
+
+        if parser.done:
+            break
+
+    parser.close()
+    yield from parser.pop_table_rows()
+
+
+def _extract_lxml(source: Union[str, Iterable[str]], table_id: str) -> Iterator[list[str]]:
+    import lxml.html
+
+    html = _require_table(join_source(source), table_id)
+    table = lxml.html.fragment_fromstring(slice_table(html, table_id))
+    table_body = table.find("tbody")
+    countries = list(table_body.iter("tr"))[SKIPPED_ROWS:]
+    for country in countries:
+        yield [cell.text_content() for cell in country.iter("td")]
+
+
+def _extract_soup(source: Union[str, Iterable[str]], table_id: str) -> Iterator[list[str]]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(_require_table(join_source(source), table_id), "html.parser")
+    table = soup.find(id=table_id)
+    table_body = table.find("tbody")
+    countries = table_body.find_all("tr")[SKIPPED_ROWS:]
+    for country in countries:
+        yield [cell.text for cell in country.find_all("td")]
+
+
+def _extract_selectolax(source: Union[str, Iterable[str]], table_id: str) -> Iterator[list[str]]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    html = _require_table(join_source(source), table_id)
+    table = LexborHTMLParser(slice_table(html, table_id)).css_first(f"#{table_id}")
+    table_body = table.css_first("tbody")
+    countries = table_body.css("tr")[SKIPPED_ROWS:]
+    for country in countries:
+        yield [cell.text() for cell in country.css("td")]
+
+
+def _require_table(html: str, table_id: str) -> str:
+    if f'id="{table_id}"' not in html:
+        raise ParseError(f"Table {table_id} could not be found")
+    return html
+
+
+PARSER_BACKENDS: dict[str, ParserBackend] = {
+    backend.name: backend for backend in (
+        ParserBackend("selectolax", ("selectolax",), _extract_selectolax),
+        ParserBackend("lxml", ("lxml",), _extract_lxml),
+        ParserBackend("streaming", (), _extract_streaming, _extract_streaming_tables),
+        ParserBackend("html.parser", ("bs4",), _extract_soup),
+    )
+}
+
+
+def seek_table(html: str, table_id: str) -> str:
+    """
+    Returns the given HTML starting from the opening tag of the table with the given id, or the whole HTML if the
+    table could not be located by a plain text search.
+    """
+    id_index = html.find(f'id="{table_id}"')
+    if id_index == -1:
+        return html
+
+    start = html.rfind("<table", 0, id_index)
+    return html[start:] if start != -1 else html
+
+
+def slice_table(html: str, table_id: str) -> str:
+    """
+    Returns only the HTML of the table with the given id. The worldometers tables do not nest other tables, so the
+    first closing table tag after the opening tag ends it.
+    """
+    table_html = seek_table(html, table_id)
+    end = table_html.find("</table>")
+    return table_html[:end + len("</table>")] if end != -1 else table_html
+
+
+def join_source(source: Union[str, Iterable[str]]) -> str:
+    return source if isinstance(source, str) else "".join(source)
+
+
+def iter_chunks(text: str, size: int = CHUNK_SIZE) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+
+def sanitise_row(cells: list[str]) -> CoronaData:
+    country, *numbers = cells[CELL_SLICE]
+    return CoronaData(sanitise_country(country), *convert_column(numbers))
+
+
+def sanitise_country(value: str) -> str:
+    return value.replace(",", "").strip()
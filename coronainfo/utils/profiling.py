@@ -0,0 +1,130 @@
+import builtins
+import importlib.util
+import logging
+import os
+import sys
+import threading
+import time
+
+ENABLED = bool(os.environ.get("CORONAINFO_PROFILE"))
+REPORTED_IMPORTS = 15
+
+
+class ImportTimer:
+    """
+    Times every module imported on the thread that started it, by wrapping `__import__`. Each module gets its own
+    time, excluding the modules it imported itself, and its cumulative time, including them. Modules that were
+    already imported before it started are not timed.
+    """
+
+    def __init__(self):
+        self.timings: list[tuple[str, float, float]] = []
+        self._children: list[float] = []
+        self._original = builtins.__import__
+        self._thread = threading.get_ident()
+
+    def start(self):
+        self._original = builtins.__import__
+        self._thread = threading.get_ident()
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if builtins.__import__ is self._import:
+            builtins.__import__ = self._original
+
+    def _import(self, name: str, globals: dict = None, locals: dict = None, fromlist: tuple = (), level: int = 0):
+        if threading.get_ident() == self._thread:
+            absolute = name
+            if level:
+                absolute = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+
+            if absolute not in sys.modules:
+                self._time(absolute)
+
+            # Submodules named in the fromlist are loaded by the import system directly, without going through
+            # `__import__`, so the ones that are not loaded yet are imported and timed here first
+            module = sys.modules.get(absolute)
+            for item in fromlist or ():
+                submodule = f"{absolute}.{item}"
+                if item != "*" and hasattr(module, "__path__") and not hasattr(module, item) \
+                        and submodule not in sys.modules:
+                    self._time(submodule, optional=True)
+
+        return self._original(name, globals, locals, fromlist, level)
+
+    def _time(self, name: str, optional: bool = False):
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._original(name)
+        except ModuleNotFoundError as err:
+            # A fromlist entry that is not a submodule is left for the import itself to resolve
+            if not optional or err.name != name:
+                raise
+        finally:
+            total = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += total
+            if name in sys.modules:
+                self.timings.append((name, total - children, total))
+
+
+class StartupProfiler:
+    """
+    Records how long startup takes to reach each milestone, along with which imports it spent that time on.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.imports = ImportTimer()
+        self.marks: list[tuple[str, float]] = []
+        self.finished = False
+
+    def mark(self, label: str):
+        elapsed = time.perf_counter() - self.start
+        self.marks.append((label, elapsed))
+        logging.info(f"[profile] {label}: {elapsed * 1000:.1f} ms")
+
+    def report(self) -> str:
+        lines = ["Startup profile", "  Milestones (since the profiler started):"]
+        lines += [f"    {elapsed * 1000:9.1f} ms  {label}" for label, elapsed in self.marks]
+
+        import_total = sum(own for _, own, _ in self.imports.timings)
+        lines.append(f"  Imports: {len(self.imports.timings)} modules, {import_total * 1000:.1f} ms")
+        lines.append("       self   cumulative  module")
+        slowest = sorted(self.imports.timings, key=lambda timing: timing[2], reverse=True)[:REPORTED_IMPORTS]
+        lines += [f"    {own * 1000:7.1f} ms {total * 1000:7.1f} ms  {name}" for name, own, total in slowest]
+        return "\n".join(lines)
+
+
+_profiler: StartupProfiler = None
+
+
+def start():
+    """
+    Starts profiling startup if CORONAINFO_PROFILE is set. Only imports from then on are timed, so the launchers
+    call it before they import anything else. Calling it again does nothing.
+    """
+    global _profiler
+    if ENABLED and _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.imports.start()
+
+
+def mark(label: str):
+    if _profiler is not None and not _profiler.finished:
+        _profiler.mark(label)
+
+
+def finish(label: str):
+    """
+    Records the last milestone of startup and logs the whole profile. Only the first call does anything.
+    """
+    if _profiler is None or _profiler.finished:
+        return
+
+    _profiler.mark(label)
+    _profiler.finished = True
+    _profiler.imports.stop()
+    logging.info(_profiler.report())
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+import urllib.error
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Union
+
+from coronainfo.models import CoronaDataset
+from coronainfo.utils.fetch import (
+    CacheValidators, Cancellable, FETCH_TIMEOUT, FetchCancelled, WORLDOMETERS_URL, fetch_page
+)
+from coronainfo.utils.parsers import (
+    DEFAULT_BACKEND, TODAY_TABLE_ID, YESTERDAY2_TABLE_ID, YESTERDAY_TABLE_ID, parse_datasets
+)
+
+MAX_WORKERS = 4
+RETRIES = 2  # Attempts made after the first one fails
+RETRY_DELAY = 1  # Seconds to wait before the first retry, doubled for every retry after it
+
+
+class PageParseError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Source:
+    """
+    A table to fetch, identified by the URL of its page and its id on that page, and how many days before the fetch
+    its data is from.
+    """
+    name: str
+    url: str = WORLDOMETERS_URL
+    table_id: str = TODAY_TABLE_ID
+    days_ago: int = 0
+    timeout: float = FETCH_TIMEOUT
+    retries: int = RETRIES
+
+
+TODAY_SOURCE = Source("today")
+SOURCES = (
+    TODAY_SOURCE,
+    Source("yesterday", table_id=YESTERDAY_TABLE_ID, days_ago=1),
+    Source("2 days ago", table_id=YESTERDAY2_TABLE_ID, days_ago=2),
+)
+
+
+@dataclass
+class SourceResult:
+    """
+    The outcome of fetching a source: its dataset, or the error that ended the last attempt. Neither is set if the
+    page has not been modified since `validators` were stored.
+    """
+    source: Source
+    dataset: Union[CoronaDataset, None] = None
+    validators: Union[CacheValidators, None] = None
+    error: Union[BaseException, None] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.dataset is None and self.error is None
+
+
+class FetchScheduler:
+    """
+    Fetches and parses several sources concurrently on a bounded pool of threads. Sources that share a page are
+    grouped, so every page is only downloaded once, and all of its tables are parsed in a single pass on the thread
+    that downloads it. Failed downloads are retried with an increasing delay, and results are yielded as soon as
+    their page is done.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, backend: str = DEFAULT_BACKEND):
+        self.max_workers = max_workers
+        self.backend = backend
+
+    def run(self, sources: Iterable[Source], validators: Mapping[str, CacheValidators] = None,
+            cancellable: Cancellable = None) -> Iterator[SourceResult]:
+        """
+        Fetches every source, yielding their results in the order they complete. Validators are looked up by URL and
+        make the request for that page conditional.
+        """
+        validators = validators or {}
+        pages: dict[str, list[Source]] = {}
+        for source in sources:
+            pages.setdefault(source.url, []).append(source)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages)) or 1,
+                                      thread_name_prefix="fetch")
+        try:
+            pending: set[Future] = {
+                executor.submit(self._run_page, url, page_sources, validators.get(url), cancellable)
+                for url, page_sources in pages.items()
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        finally:
+            # Nothing is left to wait for once the caller stops listening
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_page(self, url: str, sources: list[Source], validators: Union[CacheValidators, None],
+                  cancellable: Union[Cancellable, None]) -> list[SourceResult]:
+        timeout = max(source.timeout for source in sources)
+        retries = max(source.retries for source in sources)
+        thread = threading.current_thread().name
+
+        for attempt in range(retries + 1):
+            try:
+                logging.debug(f"[{thread}] Fetching {url} (attempt {attempt + 1})")
+                response = fetch_page(url, validators, timeout=timeout, cancellable=cancellable)
+                if response.not_modified:
+                    return [SourceResult(source, validators=response.validators) for source in sources]
+
+                with response:
+                    # Tables are parsed while the rest of the page is still downloading
+                    datasets = self._parse_page(url, response.chunks, sources)
+
+                return [SourceResult(source, datasets[source.table_id], response.validators) for source in sources]
+
+            except FetchCancelled as err:
+                return [SourceResult(source, error=err) for source in sources]
+
+            except PageParseError as err:
+                logging.warning(f"[{thread}] {err}")
+                return [SourceResult(source, error=err) for source in sources]
+
+            except OSError as err:
+                if not _is_retryable(err) or attempt == retries or _is_cancelled(cancellable):
+                    logging.warning(f"[{thread}] Giving up on {url}: {err}")
+                    return [SourceResult(source, error=err) for source in sources]
+
+                delay = RETRY_DELAY * 2 ** attempt
+                logging.info(f"[{thread}] Fetching {url} failed ({err}), retrying in {delay} seconds")
+                time.sleep(delay)
+
+    def _parse_page(self, url: str, chunks: Iterable[str], sources: list[Source]) -> dict[str, CoronaDataset]:
+        try:
+            return parse_datasets(chunks, [source.table_id for source in sources], self.backend)
+        except (OSError, FetchCancelled):
+            # Raised by the download itself, which may still be worth retrying
+            raise
+        except Exception as err:
+            # A page that cannot be parsed will not parse any better when fetched again
+            raise PageParseError(f"Unable to parse {url}: {err}") from err
+
+
+def _is_retryable(err: OSError) -> bool:
+    # Client errors will not go away by asking again
+    return not isinstance(err, urllib.error.HTTPError) or err.code >= 500
+
+
+def _is_cancelled(cancellable: Union[Cancellable, None]) -> bool:
+    return cancellable is not None and cancellable.is_cancelled()
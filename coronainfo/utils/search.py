@@ -0,0 +1,102 @@
+import unicodedata
+from typing import Iterable
+
+NGRAM_SIZE = 3
+
+
+def fold(text: str) -> str:
+    """
+    Normalises text for searching by ignoring case and accents, so "cote" matches "Côte d'Ivoire".
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def bitset_rows(bitset: int) -> frozenset[int]:
+    """
+    Returns the rows whose bits are set in a bitset. Testing a single bit of a large bitset has to shift or mask the
+    whole integer, while decoding it once into a set makes every lookup constant time.
+    """
+    # Binary digits, least significant first
+    digits = bin(bitset)[:1:-1]
+    return frozenset(row for row, digit in enumerate(digits) if digit == "1")
+
+
+class CountrySearchIndex:
+    """
+    A substring search index over country names. Every name is folded once when the index is built, and every
+    n-gram of up to three characters maps to a bitset of the rows whose names contain it. A query ANDs the bitsets
+    of its n-grams and only verifies the few candidates that are left. Results are bitsets with one bit per row, and
+    are cached until the index is rebuilt.
+    """
+
+    def __init__(self, countries: Iterable[str] = ()):
+        self.rows: dict[str, int] = {}
+        self._names: list[str] = []
+        self._postings: dict[str, int] = {}
+        self._cache: dict[str, int] = {}
+        self.all_rows = 0
+        self.rebuild(countries)
+
+    def rebuild(self, countries: Iterable[str]):
+        self.rows = {}
+        self._names = []
+        self._postings = {}
+        self._cache = {}
+
+        # ORing a bit into a growing bitset copies the whole integer, so the rows of every n-gram are collected first
+        row_lists: dict[str, list[int]] = {}
+        for row, country in enumerate(countries):
+            self.rows[country] = row
+            name = fold(country)
+            self._names.append(name)
+
+            for ngram in {name[start:start + size] for size in range(1, NGRAM_SIZE + 1)
+                          for start in range(len(name) - size + 1)}:
+                row_lists.setdefault(ngram, []).append(row)
+
+        self._postings = {ngram: _to_bitset(rows) for ngram, rows in row_lists.items()}
+        self.all_rows = (1 << len(self._names)) - 1
+
+    def query(self, text: str) -> int:
+        """
+        Returns a bitset of the rows whose names contain the given text, ignoring case and accents.
+        """
+        needle = fold(text)
+        result = self._cache.get(needle)
+        if result is None:
+            result = self._search(needle)
+            self._cache[needle] = result
+
+        return result
+
+    def _search(self, needle: str) -> int:
+        if not needle:
+            return self.all_rows
+        if len(needle) <= NGRAM_SIZE:
+            return self._postings.get(needle, 0)
+
+        candidates = self.all_rows
+        for start in range(len(needle) - NGRAM_SIZE + 1):
+            candidates &= self._postings.get(needle[start:start + NGRAM_SIZE], 0)
+            if not candidates:
+                return 0
+
+        # Every trigram matching does not guarantee that they appear next to each other
+        result = 0
+        while candidates:
+            bit = candidates & -candidates
+            row = bit.bit_length() - 1
+            if needle in self._names[row]:
+                result |= bit
+            candidates ^= bit
+
+        return result
+
+
+def _to_bitset(rows: list[int]) -> int:
+    # Rows are in ascending order, so the last one decides the size of the bitset
+    bits = bytearray(rows[-1] // 8 + 1)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
@@ -0,0 +1,203 @@
+import io
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterator, Sequence, Union
+
+from coronainfo.models import CoronaDataset
+from coronainfo.models.model_dataset import NUMERIC_FIELDS
+from coronainfo.utils.files import write_atomic
+
+# Layout, all little-endian:
+#   header          magic, version, row count, column count, offset and size of the string table, and the CRC32 of
+#                   everything after the header
+#   column blocks   one block of `row count` int64 values per numeric column, in field order
+#   string table    `row count + 1` uint32 offsets into the UTF-8 blob of country names that follows them
+MAGIC = b"CIDS"
+VERSION = 2
+HEADER = struct.Struct("<4sHxxIHxxQQIxxxx")
+HEADERS = {
+    1: struct.Struct("<4sHxxIHxxQQ"),  # Without a checksum, still found in older history logs
+    VERSION: HEADER,
+}
+OFFSET = struct.Struct("<I")
+LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+class StringTable(Sequence[str]):
+    """
+    A read-only sequence of strings that are only decoded when accessed.
+    """
+
+    def __init__(self, offsets: Sequence[int], blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string table index out of range")
+
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+def dump_snapshot(dataset: CoronaDataset, file: BinaryIO) -> int:
+    """
+    Writes the given dataset to a binary file object in the snapshot format.
+
+    Returns
+    -------
+    int
+        The number of bytes written.
+    """
+    rows = len(dataset)
+    names = [country.encode("utf-8") for country in dataset.countries]
+    offsets = array("I", [0])
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    body = []
+    for column in dataset.columns:
+        block = column if isinstance(column, array) and column.typecode == "q" else array("q", column)
+        body.append(_little_endian(block).tobytes())
+    body.append(_little_endian(offsets).tobytes())
+    body.append(b"".join(names))
+
+    # The file may not be seekable, so the checksum goes in the header before any of the body is written
+    checksum = 0
+    for chunk in body:
+        checksum = zlib.crc32(chunk, checksum)
+
+    strings_offset = HEADER.size + rows * len(dataset.columns) * 8
+    strings_size = len(offsets) * OFFSET.size + offsets[-1]
+    file.write(HEADER.pack(MAGIC, VERSION, rows, len(dataset.columns), strings_offset, strings_size, checksum))
+    for chunk in body:
+        file.write(chunk)
+
+    return strings_offset + strings_size
+
+
+def read_snapshot(buffer: Union[bytes, memoryview, mmap.mmap], offset: int = 0,
+                  verify: bool = True) -> CoronaDataset:
+    """
+    Reads a snapshot from a buffer without copying its numeric columns. The returned dataset is read-only, and its
+    columns stay backed by the buffer, which is kept alive for as long as the dataset is.
+
+    Verifying the checksum reads the whole snapshot once, which is worth it for files that may have been left behind
+    by a crash, but not for snapshots that are read over and over again.
+
+    Raises
+    ------
+    SnapshotError
+        If the buffer does not hold a snapshot of a supported version at the given offset, or fails verification.
+    """
+    view = memoryview(buffer)[offset:]
+    if len(view) < 6:
+        raise SnapshotError("Snapshot is too small to hold a header")
+
+    magic, version = struct.unpack_from("<4sH", view)
+    if magic != MAGIC:
+        raise SnapshotError("Not a snapshot file")
+    header = HEADERS.get(version)
+    if header is None:
+        raise SnapshotError(f"Unsupported snapshot version {version}, expected at most {VERSION}")
+    if len(view) < header.size:
+        raise SnapshotError("Snapshot is too small to hold a header")
+
+    _, _, rows, column_count, strings_offset, strings_size, *checksum = header.unpack_from(view)
+    if column_count != len(NUMERIC_FIELDS):
+        raise SnapshotError(f"Expected {len(NUMERIC_FIELDS)} columns, found {column_count}")
+    if len(view) < strings_offset + strings_size:
+        raise SnapshotError("Snapshot is truncated")
+    if verify and checksum and zlib.crc32(view[header.size:strings_offset + strings_size]) != checksum[0]:
+        raise SnapshotError("Snapshot is corrupted, its checksum does not match")
+
+    columns = []
+    block_size = rows * 8
+    for i in range(column_count):
+        start = header.size + i * block_size
+        columns.append(_native_ints(view[start:start + block_size], "q"))
+
+    offsets_size = (rows + 1) * OFFSET.size
+    offsets = _native_ints(view[strings_offset:strings_offset + offsets_size], "I")
+    blob = view[strings_offset + offsets_size:strings_offset + strings_size]
+
+    return CoronaDataset(StringTable(offsets, blob), columns)
+
+
+def snapshot_size(buffer: Union[bytes, memoryview, mmap.mmap], offset: int = 0) -> int:
+    # Both header versions start with the same fields
+    header = HEADERS[1].unpack_from(buffer, offset)
+    return header[4] + header[5]
+
+
+def read_snapshots(buffer: Union[bytes, memoryview, mmap.mmap], verify: bool = True) -> Iterator[CoronaDataset]:
+    """
+    Reads every snapshot of a buffer that holds several of them one after the other, such as an export of the
+    history, without copying their numeric columns.
+
+    Raises
+    ------
+    SnapshotError
+        If anything but whole snapshots of a supported version follows the last snapshot read.
+    """
+    offset = 0
+    while offset < len(buffer):
+        dataset = read_snapshot(buffer, offset, verify)
+        yield dataset
+        offset += snapshot_size(buffer, offset)
+
+
+def write_snapshot(file_path: Union[str, Path], dataset: CoronaDataset, backup: bool = False):
+    """
+    Atomically writes the given dataset to a snapshot file. The file is written next to its destination first and
+    then renamed over it, so datasets that are still mapped from the old file stay valid.
+    """
+    buffer = io.BytesIO()
+    dump_snapshot(dataset, buffer)
+    write_atomic(file_path, buffer.getvalue(), backup)
+
+
+def load_snapshot(file_path: Union[str, Path], verify: bool = True) -> CoronaDataset:
+    """
+    Memory-maps a snapshot file and reads it without copying its numeric columns.
+
+    Raises
+    ------
+    SnapshotError
+        If the file is not a snapshot of a supported version, or fails verification.
+    """
+    with open(file_path, "rb") as file:
+        # The mapping outlives the file descriptor and is released once the dataset is garbage collected
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return read_snapshot(mapping, verify=verify)
+
+
+def _little_endian(values: array) -> array:
+    if LITTLE_ENDIAN:
+        return values
+
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
+
+
+def _native_ints(view: memoryview, typecode: str) -> Sequence[int]:
+    if LITTLE_ENDIAN:
+        return view.cast(typecode)
+
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
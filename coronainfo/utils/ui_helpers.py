@@ -1,17 +1,27 @@
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from typing import Callable, Union
 
-from gi.repository import GObject, Gio, Gtk
+from gi.repository import Gdk, GLib, GObject, Gio, Gtk, Pango
 
 from coronainfo.enums import App, Date
 from coronainfo.settings import AppSettings
 
+FRAME_BUDGET = 0.008  # Seconds of main loop time an idle callback may use before yielding for the next frame
+
 
 def run_in_thread(func: Callable, on_finish: Callable = None,
                   func_args: tuple = (), on_finish_args: tuple = (),
-                  cancellable: Gio.Cancellable = Gio.Cancellable()) -> Gio.Task:
+                  cancellable: Gio.Cancellable = None) -> Gio.Task:
     # TODO: figure out better ways to do this lmao
+    if cancellable is None:
+        # A default argument would be created once and shared by every task
+        cancellable = Gio.Cancellable()
+
     def func_wrapper(task: Gio.Task, arg2, arg3, cancellable: Gio.Cancellable = None):
         func_name = func.__name__
         logging.debug(f"Worker running function: {func_name}{func_args}")
@@ -39,6 +49,61 @@ def run_in_thread(func: Callable, on_finish: Callable = None,
     return task
 
 
+class IdleConsumer:
+    """
+    Hands batches produced on a worker thread over to the main loop. `put` and `close` may be called from any
+    thread, while `on_batch` and `on_close` always run on the main loop in idle callbacks. Each callback processes
+    batches until the frame budget is used up and then yields, so large datasets never stall the UI.
+    """
+
+    def __init__(self, on_batch: Callable[[list], None], on_close: Callable[[bool], None],
+                 budget: float = FRAME_BUDGET):
+        self.on_batch = on_batch
+        self.on_close = on_close
+        self.budget = budget
+
+        self._batches: deque[list] = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._closed = False
+        self._complete = False
+
+    def put(self, batch: list):
+        with self._lock:
+            self._batches.append(batch)
+            self._schedule()
+
+    def close(self, complete: bool = True):
+        with self._lock:
+            self._closed = True
+            self._complete = complete
+            self._schedule()
+
+    def _schedule(self):
+        # Must be called with the lock held
+        if not self._scheduled:
+            self._scheduled = True
+            GLib.idle_add(self._consume)
+
+    def _consume(self):
+        deadline = time.perf_counter() + self.budget
+        while time.perf_counter() < deadline:
+            with self._lock:
+                if not self._batches:
+                    self._scheduled = False
+                    closed = self._closed
+                    break
+                batch = self._batches.popleft()
+
+            self.on_batch(batch)
+        else:
+            return GLib.SOURCE_CONTINUE
+
+        if closed:
+            self.on_close(self._complete)
+        return GLib.SOURCE_REMOVE
+
+
 def create_action(self: Union[Gtk.Application, Gtk.ApplicationWindow], name: str, callback: Callable, shortcuts: list = None):
     action = Gio.SimpleAction.new(name, None)
     action.connect("activate", callback)
@@ -54,6 +119,21 @@ def create_action(self: Union[Gtk.Application, Gtk.ApplicationWindow], name: str
         app.set_accels_for_action(f"{origin}.{name}", shortcuts)
 
 
+@lru_cache(maxsize=None)
+def foreground_attributes(colour: Union[str, None]) -> Union[Pango.AttrList, None]:
+    # Only a handful of colours are ever used, so every label with the same colour shares one attribute list
+    if colour is None:
+        return None
+
+    rgba = Gdk.RGBA()
+    rgba.parse(colour)
+    attributes = Pango.AttrList()
+    attributes.insert(Pango.attr_foreground_new(
+        round(rgba.red * 0xFFFF), round(rgba.green * 0xFFFF), round(rgba.blue * 0xFFFF)
+    ))
+    return attributes
+
+
 def evaluate_title(settings: AppSettings) -> str:
     last_fetched = settings.last_fetched
 
@@ -1,6 +1,8 @@
 import logging
 
-from gi.repository import Adw, GObject, Gtk
+from gi.repository import Adw, GObject, Gio, Gtk
+
+from coronainfo import app
 
 
 @Gtk.Template(resource_path="/coronainfo/ui/preferences-dialog")
@@ -8,12 +10,15 @@ class PreferencesDialog(Adw.PreferencesWindow):
     __gtype_name__ = "PreferencesDialog"
 
     columns_group: Adw.PreferencesGroup = Gtk.Template.Child(name="columns_group")
+    max_age_spin: Gtk.SpinButton = Gtk.Template.Child(name="max_age_spin")
+    refresh_interval_spin: Gtk.SpinButton = Gtk.Template.Child(name="refresh_interval_spin")
 
     def __init__(self, parent: GObject.Object):
         super().__init__()
         self.set_transient_for(parent)
+        self._bind_settings()
 
-    def set_columns(self, columns: list[Gtk.TreeViewColumn]):
+    def set_columns(self, columns: list[Gtk.ColumnViewColumn]):
         for column in columns:
             row = Adw.ActionRow()
             toggle = Gtk.CheckButton()
@@ -32,5 +37,22 @@ class PreferencesDialog(Adw.PreferencesWindow):
 
             self.columns_group.add(row)
 
-    def on_column_visibility_changed(self, column: Gtk.TreeViewColumn, _):
+    def on_column_visibility_changed(self, column: Gtk.ColumnViewColumn, _):
         logging.debug(f"Visibility of column `{column.get_title()}` set to `{column.get_visible()}`")
+
+    def _bind_settings(self):
+        settings = app.get_schema()
+
+        settings.bind(
+            "cache-max-age",
+            self.max_age_spin,
+            "value",
+            Gio.SettingsBindFlags.DEFAULT
+        )
+
+        settings.bind(
+            "refresh-interval",
+            self.refresh_interval_spin,
+            "value",
+            Gio.SettingsBindFlags.DEFAULT
+        )
@@ -22,6 +22,7 @@ from gi.repository import Adw, GObject, Gio, Gtk
 
 from coronainfo import app
 from coronainfo.controllers import AppController
+from coronainfo.utils import profiling
 from coronainfo.utils.ui_helpers import create_action, evaluate_title, log_action_call
 from coronainfo.views.dialog_preferences import PreferencesDialog
 
@@ -43,7 +44,7 @@ class MainWindow(Adw.ApplicationWindow):
     searchbar: Gtk.SearchBar = Gtk.Template.Child(name="searchbar")
     search_entry: Gtk.SearchEntry = Gtk.Template.Child(name="search_entry")
     statuspage: Adw.StatusPage = Gtk.Template.Child(name="statuspage")
-    table: Gtk.TreeView = Gtk.Template.Child(name="table_view")
+    table: Gtk.ColumnView = Gtk.Template.Child(name="table_view")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -52,6 +53,7 @@ class MainWindow(Adw.ApplicationWindow):
         self._bind_properties()
 
         create_action(self, "refresh-data", self.on_refresh_action, ["<Ctrl>r"])
+        create_action(self, "cancel-refresh", self.on_cancel_refresh_action, ["<Ctrl><Shift>r"])
         create_action(self, "save-data", self.on_save_action, ["<Ctrl>s"])
         create_action(self, "preferences", self.on_preferences_action, ["<Ctrl>comma"])
         create_action(self, "toggle-search", self.on_toggle_search_action)
@@ -75,15 +77,17 @@ class MainWindow(Adw.ApplicationWindow):
         self.controller.set_table(self.table)
         self.controller.start_populate()
 
-    def on_populate_started(self, controller):
+    def on_populate_started(self, controller, background: bool):
         self.refresh_btn.set_sensitive(False)
-        self.spinner_box.set_visible(True)
-        self.spinner.start()
+        if not background:
+            self.spinner_box.set_visible(True)
+            self.spinner.start()
 
     def on_populate_finished(self, controller):
         self.spinner.stop()
         self.spinner_box.set_visible(False)
         self.refresh_btn.set_sensitive(True)
+        profiling.finish("Table populated")
 
     def on_progress_emitted(self, controller, message: str):
         self.set_title(message)
@@ -96,6 +100,10 @@ class MainWindow(Adw.ApplicationWindow):
         log_action_call(action)
         self.controller.on_refresh()
 
+    def on_cancel_refresh_action(self, action: Gio.SimpleAction, param):
+        log_action_call(action)
+        self.controller.on_cancel_refresh()
+
     def on_save_action(self, action: Gio.SimpleAction, param):
         log_action_call(action)
         self.controller.on_save(self)
@@ -108,7 +116,7 @@ class MainWindow(Adw.ApplicationWindow):
     def on_preferences_action(self, action: Gio.SimpleAction, param):
         log_action_call(action)
         settings = PreferencesDialog(self)
-        settings.set_columns(self.table.get_columns())
+        settings.set_columns(self.controller.get_columns())
         settings.show()
 
     @Gtk.Template.Callback()
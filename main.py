@@ -34,8 +34,6 @@ def install_icons(source: Path, destination: Path):
 
 
 def main():
-    from gi.repository import Gio
-
     # Set environment variable(s)
     os.environ["CORONAINFO_DEBUG"] = "1"
 
@@ -63,7 +61,12 @@ def main():
     # Install icons
     installed_icons = install_icons(SCICONS_SRC, SCICONS_DEST) + install_icons(SYICONS_SRC, SYICONS_DEST)
 
+    # Profile startup from here on, if enabled, so gi is timed too but compiling and installing files is not
+    from coronainfo.utils import profiling
+    profiling.start()
+
     # Load resources
+    from gi.repository import Gio
     resource = Gio.Resource.load(str(GRESOURCE_BIN))
     resource._register()
 